@@ -21,10 +21,11 @@ Config dict keys:
         ``execute_create_from_agent``.  ``None`` skips validation.
 """
 
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import yaml
 
@@ -42,6 +43,7 @@ from shared.utils import (
     validate_description,
     validate_name,
     validate_version,
+    yaml_safe_load,
 )
 
 
@@ -50,30 +52,33 @@ from shared.utils import (
 # ------------------------------------------------------------------
 
 
-def find_extensions(
-    config: Dict[str, Any],
-    location: str = "all",
-    plugin_path: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Find all extensions of a given type via frontmatter parsing.
+def _iter_markdown_files(search_dir: Path) -> Iterator[Path]:
+    """Yield every ``*.md`` file below ``search_dir``, recursively.
 
-    Walks the configured directory looking for Markdown files whose
-    YAML frontmatter ``type`` matches ``config["frontmatter_type"]``.
+    ``os.walk`` is built on ``os.scandir``, so files and directories
+    are told apart from the directory entries rather than with a
+    ``stat`` per path.  Symlinked directories are not descended
+    into, as with the ``**`` glob this replaces, so a link loop
+    cannot repeat entries.  The suffix check goes through
+    ``os.path.normcase`` so it is case-insensitive on Windows, as
+    the glob was.
+    """
+    for dirpath, _dirnames, filenames in os.walk(search_dir):
+        for filename in filenames:
+            if os.path.normcase(filename).endswith(".md"):
+                yield Path(dirpath, filename)
 
-    Note: this function is designed for frontmatter-based extensions
-    (agents, skills).  Plugin-manager has its own ``find_components``
-    because plugins use JSON metadata.
 
-    Args:
-        config: Extension type configuration dict.
-        location: Where to search (user, project, plugin, all).
-        plugin_path: Path to plugin directory.
+def _iter_extensions(
+    config: Dict[str, Any],
+    location: str = "all",
+    plugin_path: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield extension info dicts one file at a time.
 
-    Returns:
-        List of extension info dictionaries.
+    Backs ``find_extensions``; lazy so that ``extension_exists`` can
+    stop parsing frontmatter as soon as it sees a match.
     """
-    components: List[Dict[str, Any]] = []
-
     locations_to_search: List[str] = []
     if location == "all":
         locations_to_search = ["user", "project"]
@@ -91,7 +96,7 @@ def find_extensions(
         if not search_dir.exists():
             continue
 
-        for md_file in search_dir.glob("**/*.md"):
+        for md_file in _iter_markdown_files(search_dir):
             if (
                 md_file.name.startswith("_")
                 or md_file.name == "README.md"
@@ -108,37 +113,52 @@ def find_extensions(
                     continue
 
                 fm_text = content[3:end].strip()
-                parsed = yaml.safe_load(fm_text)
+                parsed = yaml_safe_load(fm_text)
                 frontmatter: Dict[str, Any] = (
                     parsed if isinstance(parsed, dict) else {}
                 )
-
-                if frontmatter.get("type") == expected_type:
-                    # Prefer parent dir name for skills
-                    fallback_name = (
-                        md_file.parent.name
-                        if md_file.name != md_file.parent.name + ".md"
-                        else md_file.stem
-                    )
-                    components.append(
-                        {
-                            "name": frontmatter.get(
-                                "name", fallback_name
-                            ),
-                            "version": frontmatter.get(
-                                "version", "0.0.0"
-                            ),
-                            "description": frontmatter.get(
-                                "description", ""
-                            ),
-                            "location": loc,
-                            "path": str(md_file),
-                        }
-                    )
             except (IOError, UnicodeDecodeError, yaml.YAMLError):
-                pass
+                continue
+
+            if frontmatter.get("type") == expected_type:
+                # Prefer parent dir name for skills
+                fallback_name = (
+                    md_file.parent.name
+                    if md_file.name != md_file.parent.name + ".md"
+                    else md_file.stem
+                )
+                yield {
+                    "name": frontmatter.get("name", fallback_name),
+                    "version": frontmatter.get("version", "0.0.0"),
+                    "description": frontmatter.get("description", ""),
+                    "location": loc,
+                    "path": str(md_file),
+                }
 
-    return components
+
+def find_extensions(
+    config: Dict[str, Any],
+    location: str = "all",
+    plugin_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Find all extensions of a given type via frontmatter parsing.
+
+    Walks the configured directory looking for Markdown files whose
+    YAML frontmatter ``type`` matches ``config["frontmatter_type"]``.
+
+    Note: this function is designed for frontmatter-based extensions
+    (agents, skills).  Plugin-manager has its own ``find_components``
+    because plugins use JSON metadata.
+
+    Args:
+        config: Extension type configuration dict.
+        location: Where to search (user, project, plugin, all).
+        plugin_path: Path to plugin directory.
+
+    Returns:
+        List of extension info dictionaries.
+    """
+    return list(_iter_extensions(config, location, plugin_path))
 
 
 def extension_exists(
@@ -150,6 +170,9 @@ def extension_exists(
 ) -> bool:
     """Check if an extension with the given name exists.
 
+    With the default finder, discovery stops at the first match
+    instead of parsing every remaining file.
+
     Args:
         config: Extension type configuration dict.
         name: Extension name.
@@ -163,7 +186,7 @@ def extension_exists(
     """
     finder = find_fn or find_extensions
     if finder is find_extensions:
-        components = finder(config, location, plugin_path)
+        components = _iter_extensions(config, location, plugin_path)
     else:
         components = finder(location, plugin_path)
     return any(c["name"] == name for c in components)
@@ -683,7 +706,7 @@ def validate_file_frontmatter(
             }
 
         frontmatter_text = parts[1].strip()
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml_safe_load(frontmatter_text)
 
         if not isinstance(frontmatter, dict):
             errors.append(
@@ -14,12 +14,42 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+# Nesting limit for safe_json_load; json.loads recurses per level
+MAX_JSON_DEPTH = 64
 
-def safe_json_load(json_str: Optional[str]) -> dict[str, Any]:
-    """Safely load JSON string with size limits.
+# A string literal (closing quote optional, so a match never
+# backtracks) or a single structural bracket
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]+|\\.)*"?|[\[\]{}]')
+
+
+def _json_depth_exceeds(json_str: str, limit: int) -> bool:
+    """Check whether JSON text nests objects/arrays deeper than ``limit``.
+
+    Brackets inside string literals are ignored.  Text with no more
+    opening brackets than ``limit`` cannot exceed it, so the scan is
+    skipped for typical inputs.
+    """
+    if json_str.count("{") + json_str.count("[") <= limit:
+        return False
+    depth = 0
+    for token in _JSON_TOKEN_RE.findall(json_str):
+        if token in ("{", "["):
+            depth += 1
+            if depth > limit:
+                return True
+        elif token in ("}", "]"):
+            depth -= 1
+    return False
+
+
+def safe_json_load(
+    json_str: Optional[str], max_depth: int = MAX_JSON_DEPTH
+) -> dict[str, Any]:
+    """Safely load JSON string with size and nesting limits.
 
     Args:
         json_str: JSON string to parse, or None
+        max_depth: Maximum object/array nesting depth
 
     Returns:
         Parsed dictionary
@@ -34,12 +64,22 @@ def safe_json_load(json_str: Optional[str]) -> dict[str, Any]:
     if len(json_str) > 100 * 1024:
         raise ValueError("JSON input exceeds size limit (100KB)")
 
+    # Depth limit: reject before json.loads recurses into it
+    if _json_depth_exceeds(json_str, max_depth):
+        raise ValueError(
+            f"JSON input exceeds nesting limit ({max_depth} levels)"
+        )
+
     try:
         return json.loads(json_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {e}")
 
 
+_KEBAB_DISALLOWED_RE = re.compile(r'[^\w\s-]')
+_KEBAB_SEPARATOR_RE = re.compile(r'[\s_-]+')
+
+
 def to_kebab_case(text: str) -> str:
     """Convert text to kebab-case for component names.
 
@@ -56,16 +96,11 @@ def to_kebab_case(text: str) -> str:
         'handles-api-requests'
     """
     # Remove special characters except spaces and hyphens
-    text = re.sub(r'[^\w\s-]', '', text)
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
-    # Convert to lowercase
-    text = text.lower()
-    # Remove leading/trailing hyphens
-    text = text.strip('-')
-    # Collapse multiple hyphens
-    text = re.sub(r'-+', '-', text)
-    return text
+    text = _KEBAB_DISALLOWED_RE.sub('', text)
+    # Collapse runs of spaces, underscores and hyphens to one hyphen
+    text = _KEBAB_SEPARATOR_RE.sub('-', text)
+    # Convert to lowercase and remove leading/trailing hyphens
+    return text.lower().strip('-')
 
 
 def infer_from_description(description: str) -> dict[str, Any]:
@@ -205,6 +240,38 @@ def bump_version(version: str, bump_type: str) -> str:
     return f"{major}.{minor}.{patch}"
 
 
+@lru_cache(maxsize=1)
+def _yaml_safe_loader() -> Any:
+    """Return PyYAML's safe loader, LibYAML-backed when available.
+
+    ``CSafeLoader`` accepts the same documents as ``SafeLoader`` but
+    parses in C; PyYAML builds without LibYAML only provide the latter.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_safe_load(yaml_str: str) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Equivalent to ``yaml.safe_load`` but uses ``CSafeLoader`` when
+    PyYAML was built with LibYAML.
+
+    Args:
+        yaml_str: YAML text to parse
+
+    Returns:
+        The parsed document
+
+    Raises:
+        yaml.YAMLError: If the YAML is invalid
+    """
+    import yaml
+
+    return yaml.load(yaml_str, Loader=_yaml_safe_loader())
+
+
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown content.
 
@@ -227,14 +294,14 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
             frontmatter_text = content[3:end].strip()
             body = content[end + 3:].strip()
 
-            try:
-                import yaml
-
-                parsed = yaml.safe_load(frontmatter_text)
-                if isinstance(parsed, dict):
-                    frontmatter = parsed
-            except Exception:
-                pass
+            # An empty block cannot yield a mapping; skip the parser
+            if frontmatter_text:
+                try:
+                    parsed = yaml_safe_load(frontmatter_text)
+                    if isinstance(parsed, dict):
+                        frontmatter = parsed
+                except Exception:
+                    pass
 
     return frontmatter, body
 
@@ -243,6 +310,10 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
 def _get_jinja_env(templates_dir: str) -> Any:
     """Get or create a cached Jinja2 Environment for a templates directory.
 
+    Templates ship with the plugin and do not change while a command
+    runs, so ``auto_reload`` is off: compiled templates are reused
+    without re-checking the source file's mtime on every lookup.
+
     Args:
         templates_dir: String path to templates directory (string for hashability)
 
@@ -254,6 +325,7 @@ def _get_jinja_env(templates_dir: str) -> Any:
     return Environment(
         loader=FileSystemLoader(templates_dir),
         autoescape=False,
+        auto_reload=False,
         trim_blocks=True,
         lstrip_blocks=True,
         keep_trailing_newline=True,
@@ -28,6 +28,7 @@ from shared.extension_utils import (
     execute_extension_list,
     execute_extension_validate,
     execute_extension_version,
+    extension_exists,
     find_extensions,
     get_extension_questions,
     validate_agent_output,  # noqa: F401  re-exported
@@ -87,8 +88,9 @@ def agent_exists(
     Returns:
         True if agent exists
     """
-    agents = find_agents(location, plugin_path)
-    return any(a["name"] == name for a in agents)
+    return extension_exists(
+        AGENT_CONFIG, name, location, plugin_path
+    )
 
 
 # ------------------------------------------------------------------
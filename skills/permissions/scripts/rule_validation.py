@@ -12,6 +12,7 @@ Centralizes rule syntax validation used by both scanner.py
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 # Only allow safe ASCII characters inside rule patterns.
 # This prevents Unicode homoglyph confusion and shell
@@ -39,6 +40,17 @@ def validate_rule(rule: str) -> tuple[bool, str | None]:
             f"Rule too long ({len(rule)} chars, "
             f"max {MAX_RULE_LENGTH}): {rule[:50]!r}..."
         )
+    return _validate_rule_text(rule)
+
+
+@lru_cache(maxsize=4096)
+def _validate_rule_text(rule: str) -> tuple[bool, str | None]:
+    """Check the characters and syntax of a length-checked rule.
+
+    Plugins commonly declare the same rules, and a scan validates
+    every rule of every plugin, so results are cached per string.
+    Only rules within ``MAX_RULE_LENGTH`` reach this cache.
+    """
     if not rule.isascii():
         return False, (
             f"Rule contains non-ASCII characters: {rule[:50]!r}. "
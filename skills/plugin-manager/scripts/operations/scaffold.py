@@ -20,7 +20,7 @@ import shlex
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from .utils import (
     validate_name,
@@ -276,90 +276,86 @@ def get_questions(
     }
 
 
-def execute(context: dict[str, Any]) -> dict[str, Any]:
-    """Phase 2: Execute scaffolding with the provided context.
+def validate_context(
+    context: dict[str, Any],
+) -> tuple[bool, Optional[str]]:
+    """Validate a scaffold context before anything is written.
+
+    Runs every check ``execute`` performs before it renders
+    templates or creates the target directory.
 
     Args:
         context: Full context with all required fields
 
     Returns:
-        Result dictionary with success status and details
+        Tuple of (is_valid, error_message)
     """
-    # Validate required fields
     plugin_name = context.get("plugin_name", "")
     if not plugin_name:
-        return {
-            "success": False,
-            "message": "plugin_name is required",
-        }
+        return False, "plugin_name is required"
 
     plugin_name = to_kebab_case(plugin_name)
 
     is_valid, error = validate_name(plugin_name)
     if not is_valid:
-        return {
-            "success": False,
-            "message": f"Invalid plugin name: {error}",
-        }
+        return False, f"Invalid plugin name: {error}"
 
-    description = context.get("description", "")
-    is_valid, error = validate_description(description)
+    is_valid, error = validate_description(
+        context.get("description", "")
+    )
     if not is_valid:
-        return {
-            "success": False,
-            "message": f"Invalid description: {error}",
-        }
+        return False, f"Invalid description: {error}"
 
-    version = context.get("version", "0.1.0")
-    is_valid, error = validate_version(version)
+    is_valid, error = validate_version(
+        context.get("version", "0.1.0")
+    )
     if not is_valid:
-        return {
-            "success": False,
-            "message": f"Invalid version: {error}",
-        }
+        return False, f"Invalid version: {error}"
 
     language = context.get("language", "python")
     if language not in SUPPORTED_LANGUAGES:
-        return {
-            "success": False,
-            "message": f"Unsupported language: {language}",
-        }
+        return False, f"Unsupported language: {language}"
 
     license_id = context.get("license", "UNLICENSED")
     if license_id not in SUPPORTED_LICENSES:
-        return {
-            "success": False,
-            "message": f"Unsupported license: {license_id}",
-        }
+        return False, f"Unsupported license: {license_id}"
 
     author_name = context.get("author_name", "")
     author_email = context.get("author_email", "")
     if not author_name or not author_name.strip():
-        return {
-            "success": False,
-            "message": "author_name is required",
-        }
+        return False, "author_name is required"
     if not author_email or not author_email.strip():
-        return {
-            "success": False,
-            "message": "author_email is required",
-        }
+        return False, "author_email is required"
 
-    # Resolve target directory
-    target_str = context.get("target_directory", "")
-    if not target_str:
-        target_str = resolve_default_target(plugin_name)
+    target = _resolve_target(context, plugin_name)
+    is_valid, error = validate_target_directory(str(target))
+    if not is_valid:
+        return False, f"Invalid target directory: {error}"
 
-    target = Path(target_str).resolve()
+    return True, None
 
-    is_valid, error = validate_target_directory(str(target))
+
+def execute(context: dict[str, Any]) -> dict[str, Any]:
+    """Phase 2: Execute scaffolding with the provided context.
+
+    Args:
+        context: Full context with all required fields
+
+    Returns:
+        Result dictionary with success status and details
+    """
+    is_valid, error = validate_context(context)
     if not is_valid:
-        return {
-            "success": False,
-            "message": (
-                f"Invalid target directory: {error}"
-            ),
-        }
+        return {"success": False, "message": error}
+
+    plugin_name = to_kebab_case(context["plugin_name"])
+    description = context["description"]
+    version = context.get("version", "0.1.0")
+    language = context.get("language", "python")
+    license_id = context.get("license", "UNLICENSED")
+    author_name = context["author_name"]
+    author_email = context["author_email"]
+    target = _resolve_target(context, plugin_name)
 
     # Build template variables
     try:
@@ -515,6 +511,16 @@ def execute(context: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _resolve_target(
+    context: dict[str, Any], plugin_name: str
+) -> Path:
+    """Resolve the target directory, defaulting to cwd/plugin_name."""
+    target_str = context.get("target_directory", "")
+    if not target_str:
+        target_str = resolve_default_target(plugin_name)
+    return Path(target_str).resolve()
+
+
 def _build_next_steps(
     plugin_name: str,
     target: Path,
@@ -11,11 +11,33 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 from shared.spdx import render_spdx_blocks, resolve_spdx_context
 from shared.utils import render_template
 
+# Jinja2 delimiters; a template without any of them renders verbatim
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+def _render_static_template(templates_dir: Path, template_name: str) -> str:
+    """Render a variable-free template, skipping Jinja for plain text.
+
+    Templates containing no Jinja markup render to their source text
+    unchanged, so they are read directly instead of being compiled.
+
+    Args:
+        templates_dir: Path to templates directory
+        template_name: Name of template file relative to templates_dir
+
+    Returns:
+        Rendered template string
+    """
+    source = (templates_dir / template_name).read_text(encoding="utf-8")
+    if any(marker in source for marker in _JINJA_MARKERS):
+        return render_template(templates_dir, template_name, {})
+    return source
+
 
 def create_directory_structure(
     target: Path, language: str
@@ -370,24 +392,21 @@ def assemble_gitignore(
     """
     parts = []
 
-    shared_content = render_template(
+    shared_content = _render_static_template(
         templates_dir,
         "shared/gitignore-shared.jinja2",
-        {},
     )
     parts.append(shared_content)
 
     if language == "python":
-        lang_content = render_template(
+        lang_content = _render_static_template(
             templates_dir,
             "python/gitignore-python.jinja2",
-            {},
         )
     else:
-        lang_content = render_template(
+        lang_content = _render_static_template(
             templates_dir,
             "typescript/gitignore-node.jinja2",
-            {},
         )
     parts.append(lang_content)
 
@@ -443,17 +462,21 @@ def assemble_makefile(
     return "Makefile"
 
 
-def initialize_git(target: Path) -> bool:
+def initialize_git(
+    target: Path, *, runner: Optional[Callable[..., Any]] = None
+) -> bool:
     """Initialize a git repository in the target directory.
 
     Args:
         target: Target directory path
+        runner: Replacement for ``subprocess.run`` (defaults to it)
 
     Returns:
         True if git init succeeded
     """
+    run = runner or subprocess.run
     try:
-        result = subprocess.run(
+        result = run(
             ["git", "init"],
             cwd=target,
             capture_output=True,
@@ -465,17 +488,21 @@ def initialize_git(target: Path) -> bool:
         return False
 
 
-def create_initial_commit(target: Path) -> bool:
+def create_initial_commit(
+    target: Path, *, runner: Optional[Callable[..., Any]] = None
+) -> bool:
     """Create the initial commit in the scaffolded repo.
 
     Args:
         target: Target directory path
+        runner: Replacement for ``subprocess.run`` (defaults to it)
 
     Returns:
         True if commit succeeded
     """
+    run = runner or subprocess.run
     try:
-        add_result = subprocess.run(
+        add_result = run(
             ["git", "add", "."],
             cwd=target,
             capture_output=True,
@@ -485,7 +512,7 @@ def create_initial_commit(target: Path) -> bool:
         if add_result.returncode != 0:
             return False
 
-        commit_result = subprocess.run(
+        commit_result = run(
             [
                 "git",
                 "commit",
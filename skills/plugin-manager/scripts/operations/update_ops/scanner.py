@@ -128,7 +128,7 @@ def _read_plugin_metadata(
         plugin_path / ".claude-plugin" / "plugin.json"
     )
     try:
-        return json.loads(plugin_json.read_text())
+        return json.loads(plugin_json.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning(
             "Failed to read plugin.json: %s", exc
@@ -148,12 +148,11 @@ def _read_generator_version(plugin_path: Path) -> str:
     config_path = (
         plugin_path / ".claude-plugin" / "aida-config.json"
     )
-    if not config_path.exists():
-        return "0.0.0"
-
     try:
-        data = json.loads(config_path.read_text())
+        data = json.loads(config_path.read_bytes())
         return data.get("generator_version", "0.0.0")
+    except FileNotFoundError:
+        return "0.0.0"
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning(
             "Failed to read aida-config.json: %s", exc
@@ -198,7 +197,8 @@ def _build_scan_context(
 
     Extracts values from plugin.json and supplements with
     git config for fields not stored in the manifest (e.g.
-    author_email).
+    author_email).  Git is only consulted when one of the
+    author fields is missing, since it costs two subprocesses.
 
     Args:
         plugin_path: Absolute path to the plugin directory
@@ -208,12 +208,6 @@ def _build_scan_context(
     Returns:
         Context dict suitable for build_template_variables()
     """
-    # Import here to avoid circular dependency at module
-    # level; scaffold_ops.context is a sibling subpackage.
-    from ..scaffold_ops.context import infer_git_config
-
-    git_config = infer_git_config()
-
     # plugin.json stores author as an object or a string
     author_field = metadata.get("author", "")
     if isinstance(author_field, dict):
@@ -224,10 +218,16 @@ def _build_scan_context(
         author_email = ""
 
     # Fall back to git config when metadata is incomplete
-    if not author_name:
-        author_name = git_config.get("author_name", "")
-    if not author_email:
-        author_email = git_config.get("author_email", "")
+    if not author_name or not author_email:
+        # Import here to avoid circular dependency at module
+        # level; scaffold_ops.context is a sibling subpackage.
+        from ..scaffold_ops.context import infer_git_config
+
+        git_config = infer_git_config()
+        if not author_name:
+            author_name = git_config.get("author_name", "")
+        if not author_email:
+            author_email = git_config.get("author_email", "")
 
     keywords = metadata.get("keywords", [])
 
@@ -495,14 +495,13 @@ def _compare_gitignore(
         )
 
     actual_content = actual_path.read_text()
-    expected_entries = parse_gitignore_entries(
-        expected_content
-    )
-    actual_entries = parse_gitignore_entries(
-        actual_content
-    )
-
-    missing = expected_entries - actual_entries
+    # An untouched scaffold file needs no entry-by-entry parse
+    if actual_content == expected_content:
+        missing = set()
+    else:
+        missing = parse_gitignore_entries(
+            expected_content
+        ) - parse_gitignore_entries(actual_content)
 
     if not missing:
         return FileDiff(
@@ -609,14 +608,13 @@ def _compare_makefile(
         )
 
     actual_content = actual_path.read_text()
-    expected_targets = extract_makefile_targets(
-        expected_content
-    )
-    actual_targets = extract_makefile_targets(
-        actual_content
-    )
-
-    missing = expected_targets - actual_targets
+    # An untouched scaffold file needs no target-by-target parse
+    if actual_content == expected_content:
+        missing = set()
+    else:
+        missing = extract_makefile_targets(
+            expected_content
+        ) - extract_makefile_targets(actual_content)
 
     if not missing:
         return FileDiff(
@@ -27,6 +27,7 @@ from shared.extension_utils import (
     execute_extension_list,
     execute_extension_validate,
     execute_extension_version,
+    extension_exists,
     find_extensions,
     get_extension_questions,
     validate_file_frontmatter as _validate_file_frontmatter,
@@ -83,8 +84,9 @@ def component_exists(
     Returns:
         True if skill exists
     """
-    components = find_components(location, plugin_path)
-    return any(c["name"] == name for c in components)
+    return extension_exists(
+        SKILL_CONFIG, name, location, plugin_path
+    )
 
 
 # ------------------------------------------------------------------
@@ -5,11 +5,41 @@
 
 Handles sys.modules restoration to prevent cross-skill module
 pollution when multiple test files import different skills'
-``operations`` packages in a single pytest session.
+``operations`` packages in a single pytest session, and the
+``--runslow`` switch for tests marked ``slow``.
 """
 
 import sys
 
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the ``--runslow`` command line option."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow",
+    )
+
+
+def pytest_configure(config):
+    """Register the ``slow`` marker."""
+    config.addinivalue_line(
+        "markers", "slow: end-to-end test skipped unless --runslow is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked ``slow`` unless ``--runslow`` was given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 def pytest_runtest_setup(item):
     """Restore the correct operations modules before each test.
@@ -24,6 +54,13 @@ def pytest_runtest_setup(item):
     if snapshot is None:
         return
 
+    # Consecutive tests from the same module usually find the snapshot
+    # already in place; skip the full sys.modules walk in that case.
+    # Stray modules from another skill are only possible when the
+    # package root differs, since imports below it reuse that root.
+    if all(sys.modules.get(k) is v for k, v in snapshot.items()):
+        return
+
     # Clear any operations modules currently cached
     for key in list(sys.modules):
         if key == "operations" or key.startswith("operations."):
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 The AIDA Core Authors
+# SPDX-License-Identifier: MPL-2.0
+
+"""Shared setup for the plugin-manager scaffold tests.
+
+Thin wrappers over ``_skill_imports`` bound to plugin-manager, plus
+the template path and temp-dir helpers the scaffold tests share.
+``SCRATCH_DIR`` is re-exported from ``_skill_imports``.
+Test modules call ``prepare_plugin_manager_imports()`` explicitly
+before importing ``operations``.
+"""
+
+import shutil
+import tempfile
+
+from _skill_imports import (
+    PROJECT_ROOT,
+    SCRATCH_DIR,
+    prepare_skill_imports,
+    skill_scripts_dir,
+    snapshot_operations as _snapshot_skill_operations,
+)
+
+PLUGIN_SCRIPTS = skill_scripts_dir("plugin-manager")
+SCAFFOLD_TEMPLATES = (
+    PROJECT_ROOT / "skills" / "plugin-manager" / "templates" / "scaffold"
+)
+
+
+def prepare_plugin_manager_imports():
+    """Make ``import operations`` resolve to plugin-manager's package."""
+    prepare_skill_imports("plugin-manager")
+
+
+def snapshot_operations():
+    """Return plugin-manager's loaded ``operations`` modules.
+
+    See ``_skill_imports.snapshot_operations``.
+    """
+    return _snapshot_skill_operations("plugin-manager")
+
+
+def make_tmp(test):
+    """Create a temp dir that ``test`` removes during cleanup.
+
+    Cheaper than ``tempfile.TemporaryDirectory``, which registers a
+    weakref finalizer for every directory it creates.
+    """
+    tmp = tempfile.mkdtemp(dir=SCRATCH_DIR)
+    test.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+    return tmp
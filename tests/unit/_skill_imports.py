@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 The AIDA Core Authors
+# SPDX-License-Identifier: MPL-2.0
+
+"""Shared import setup for tests of a skill's ``operations`` package.
+
+Every skill ships its own top-level ``operations`` package, so a test
+module must put that skill's scripts directory first on ``sys.path``
+and drop any ``operations`` modules cached by an earlier test module
+before importing.  This module is only imported once per session, so
+test modules call ``prepare_skill_imports()`` explicitly rather than
+relying on import side effects.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_SHARED_SCRIPTS = str(PROJECT_ROOT / "scripts")
+
+
+def _scratch_dir():
+    """Return a RAM-backed directory for test scratch files, if usable.
+
+    An explicit ``TMPDIR`` always wins; otherwise ``/dev/shm`` is used
+    on systems that provide a writable one.  ``None`` means the
+    ``tempfile`` default.
+    """
+    if os.environ.get("TMPDIR"):
+        return None
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
+# Parent for temp dirs of tests that write many small files
+SCRATCH_DIR = _scratch_dir()
+
+# Per-skill ``operations`` modules loaded by earlier test modules,
+# reinstated instead of re-executing the same source for each file.
+_loaded_operations = {}
+
+
+def skill_scripts_dir(skill):
+    """Return the scripts directory of the named skill."""
+    return PROJECT_ROOT / "skills" / skill / "scripts"
+
+
+def prepare_skill_imports(skill):
+    """Make ``import operations`` resolve to ``skill``'s package.
+
+    Ensures the shared scripts directory is on ``sys.path`` and that
+    the skill's scripts directory comes first (without leaving
+    duplicate entries behind), purges ``operations`` / ``_paths``
+    modules left by other skills' tests, and reinstates any modules
+    of this skill already loaded.
+    """
+    scripts = str(skill_scripts_dir(skill))
+
+    # ``shared`` has no namesake in any skill, so its directory only
+    # needs to be present; the skill's must lead because every skill
+    # ships a top-level ``operations`` package.
+    if _SHARED_SCRIPTS not in sys.path:
+        sys.path.append(_SHARED_SCRIPTS)
+    if sys.path[0] != scripts:
+        if scripts in sys.path:
+            sys.path.remove(scripts)
+        sys.path.insert(0, scripts)
+
+    # Collect first, then delete, so sys.modules is walked only once
+    stale = tuple(
+        m for m in sys.modules if m.partition(".")[0] == "operations"
+    )
+    for name in stale:
+        del sys.modules[name]
+    sys.modules.pop("_paths", None)
+    sys.modules.update(_loaded_operations.get(skill, {}))
+
+
+def snapshot_operations(skill):
+    """Return the currently loaded ``operations`` modules.
+
+    Test modules store the result as ``_ops_snapshot`` so that
+    ``tests/conftest.py`` can reinstate it before each test.  The
+    modules are also remembered for later test modules of ``skill``.
+    """
+    snapshot = {
+        k: v for k, v in sys.modules.items()
+        if k.partition(".")[0] == "operations"
+    }
+    _loaded_operations.setdefault(skill, {}).update(snapshot)
+    return snapshot
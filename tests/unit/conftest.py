@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 The AIDA Core Authors
+# SPDX-License-Identifier: MPL-2.0
+
+"""Shared pytest fixtures for the unit tests.
+
+The ``operations`` snapshot handling lives in ``tests/conftest.py``;
+this file only holds fixtures that unit test modules request by name.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from _skill_imports import SCRATCH_DIR
+
+
+@pytest.fixture()
+def claude_dir(monkeypatch):
+    """Point every extension location lookup at a scratch ``.claude``.
+
+    Patches ``shared.extension_utils.get_location_path``, so the
+    requesting module must have ``scripts/`` on ``sys.path``.  The
+    scratch root lives under ``SCRATCH_DIR`` (RAM-backed where
+    available).  The ``.claude`` directory itself is not created;
+    tests build what they need.
+    """
+    root = tempfile.mkdtemp(dir=SCRATCH_DIR)
+    claude_dir = Path(root) / ".claude"
+    monkeypatch.setattr(
+        "shared.extension_utils.get_location_path",
+        lambda *args, **kwargs: claude_dir,
+    )
+    yield claude_dir
+    shutil.rmtree(root, ignore_errors=True)
@@ -840,6 +840,14 @@ class TestValidateRules(unittest.TestCase):
         self.assertIsNotNone(error)
         self.assertIn("non-ASCII", error)
 
+    def test_ascii_control_characters_rejected(self):
+        """Test that ASCII control characters fail the syntax check."""
+        for char in ("\x00", "\t", "\x1b", "\x7f"):
+            with self.subTest(char=repr(char)):
+                valid, error = validate_rules([f"Bash(git{char}status)"])
+                self.assertFalse(valid)
+                self.assertIn("Invalid rule syntax", error)
+
     def test_rule_too_long_rejected(self):
         """Test that rules exceeding max length are rejected."""
         rules = ["Bash(" + "a" * 500 + ":*)"]
@@ -855,6 +863,39 @@ class TestValidateRules(unittest.TestCase):
         self.assertFalse(valid)
         self.assertIn("Bash(git commit:*)", error)
 
+    def test_stops_at_first_invalid_rule(self):
+        """Test that rules after the first failure are not validated."""
+        import rule_validation
+        rules = ["Read(a.txt)", "bad-rule", "Read(b.txt)", "Read(c.txt)"]
+        with patch.object(
+            rule_validation, "validate_rule",
+            wraps=rule_validation.validate_rule,
+        ) as spy:
+            valid, error = validate_rules(rules)
+        self.assertFalse(valid)
+        self.assertIn("bad-rule", error)
+        self.assertEqual(spy.call_count, 2)
+
+    def test_repeated_rules_use_cache(self):
+        """Test that repeated rule strings reuse the cached result."""
+        from rule_validation import _validate_rule_text
+        rule = "Read(cache-check.txt)"
+        self.assertEqual(validate_rules([rule]), (True, None))
+        hits = _validate_rule_text.cache_info().hits
+        self.assertEqual(validate_rules([rule] * 3), (True, None))
+        self.assertEqual(_validate_rule_text.cache_info().hits, hits + 3)
+
+    def test_overlong_rules_bypass_cache(self):
+        """Test that rules over the length limit are never cached."""
+        from rule_validation import _validate_rule_text
+        before = _validate_rule_text.cache_info()
+        valid, _ = validate_rules(["Read(" + "b" * 600 + ")"])
+        self.assertFalse(valid)
+        after = _validate_rule_text.cache_info()
+        self.assertEqual(
+            (after.hits, after.misses), (before.hits, before.misses)
+        )
+
 
 class TestReadAllSettings(unittest.TestCase):
     """Test reading settings from all scopes."""
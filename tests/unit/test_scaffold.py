@@ -3,33 +3,102 @@
 
 """Unit tests for plugin-manager scaffold.py main entry point."""
 
-import sys
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = _project_root / "skills" / "plugin-manager" / "scripts"
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
+from _scaffold_bootstrap import (
+    SCRATCH_DIR,
+    make_tmp,
+    prepare_plugin_manager_imports,
+    snapshot_operations,
+)
 
-# Clear cached operations modules to avoid cross-manager conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith("operations."):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+prepare_plugin_manager_imports()
 
 from operations import scaffold as _scaffold_mod  # noqa: E402
 
 get_questions = _scaffold_mod.get_questions
 execute = _scaffold_mod.execute
+validate_context = _scaffold_mod.validate_context
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
+_ops_snapshot = snapshot_operations()
+
+# Fields every execute() test needs; tests merge their own overrides.
+_BASE_CONTEXT = {
+    "license": "MIT",
+    "language": "python",
+    "author_name": "Test",
+    "author_email": "test@test.com",
+}
+
+# Read-only tests share one scaffold per language instead of
+# re-rendering and re-writing a full project for every test.
+_SHARED_CONTEXTS = {
+    "python": {
+        "plugin_name": "test-plugin",
+        "description": "A test plugin for testing purposes",
+        "license": "MIT",
+        "language": "python",
+        "author_name": "Test Author",
+        "author_email": "test@example.com",
+        "keywords": "test, plugin",
+        "version": "0.1.0",
+    },
+    "typescript": {
+        "plugin_name": "ts-plugin",
+        "description": "A TypeScript test plugin for testing",
+        "license": "Apache-2.0",
+        "language": "typescript",
+        "author_name": "Test Author",
+        "author_email": "test@example.com",
+        "keywords": "",
+        "version": "0.1.0",
+    },
 }
+_shared_tmp = None
+_shared_targets = {}
+_shared_results = {}
+
+
+def setUpModule():
+    """Stub out git for the whole module and scaffold the shared projects.
+
+    No test here exercises real git, so the two git helpers are
+    patched once for the module instead of per test.
+    """
+    global _shared_tmp
+    git_patcher = patch.multiple(
+        _scaffold_mod,
+        initialize_git=MagicMock(return_value=True),
+        create_initial_commit=MagicMock(return_value=True),
+    )
+    git_patcher.start()
+    unittest.addModuleCleanup(git_patcher.stop)
+
+    _shared_tmp = tempfile.mkdtemp(dir=SCRATCH_DIR)
+    for language, context in _SHARED_CONTEXTS.items():
+        target = Path(_shared_tmp, context["plugin_name"])
+        _shared_targets[language] = target
+        _shared_results[language] = execute(
+            {**context, "target_directory": str(target)}
+        )
+
+
+def tearDownModule():
+    """Remove the shared scaffolds."""
+    shutil.rmtree(_shared_tmp, ignore_errors=True)
+    _shared_targets.clear()
+    _shared_results.clear()
+
+
+def _list_files(root):
+    """Return every file under root as a POSIX path relative to root."""
+    return {
+        p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file()
+    }
 
 
 class TestGetQuestionsNoContext(unittest.TestCase):
@@ -111,476 +180,374 @@ class TestGetQuestionsPartialContext(unittest.TestCase):
 class TestExecutePythonProject(unittest.TestCase):
     """Test execute with Python toolchain."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_full_project(self, mock_commit, mock_git):
+    def test_creates_full_project(self):
         """Should create a complete Python plugin project."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "test-plugin")
-
-            context = {
-                "plugin_name": "test-plugin",
-                "description": "A test plugin for testing purposes",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test Author",
-                "author_email": "test@example.com",
-                "keywords": "test, plugin",
-                "version": "0.1.0",
-            }
-
-            result = execute(context)
-
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-            self.assertEqual(result["language"], "python")
-            self.assertEqual(result["path"], str(Path(target).resolve()))
-
-            # Verify key files exist
-            target_path = Path(result["path"])
-            self.assertTrue((target_path / ".claude-plugin" / "plugin.json").exists())
-            self.assertTrue((target_path / "CLAUDE.md").exists())
-            self.assertTrue((target_path / "README.md").exists())
-            self.assertTrue((target_path / "LICENSE").exists())
-            self.assertTrue((target_path / "Makefile").exists())
-            self.assertTrue((target_path / ".gitignore").exists())
-            self.assertTrue((target_path / "pyproject.toml").exists())
-            self.assertTrue((target_path / ".python-version").exists())
-            self.assertTrue((target_path / "tests" / "conftest.py").exists())
+        result = _shared_results["python"]
+        target_path = _shared_targets["python"]
+
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+        self.assertEqual(result["language"], "python")
+        self.assertEqual(result["path"], str(target_path.resolve()))
+
+        # Verify key files exist
+        expected = {
+            ".claude-plugin/plugin.json",
+            "CLAUDE.md",
+            "README.md",
+            "LICENSE",
+            "Makefile",
+            ".gitignore",
+            "pyproject.toml",
+            ".python-version",
+            "tests/conftest.py",
+        }
+        self.assertEqual(expected - _list_files(target_path), set())
 
 
 class TestExecuteTypeScriptProject(unittest.TestCase):
     """Test execute with TypeScript toolchain."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_full_project(self, mock_commit, mock_git):
+    def test_creates_full_project(self):
         """Should create a complete TypeScript plugin project."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "ts-plugin")
-
-            context = {
-                "plugin_name": "ts-plugin",
-                "description": "A TypeScript test plugin for testing",
-                "license": "Apache-2.0",
-                "language": "typescript",
-                "target_directory": target,
-                "author_name": "Test Author",
-                "author_email": "test@example.com",
-                "keywords": "",
-                "version": "0.1.0",
-            }
-
-            result = execute(context)
-
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-            self.assertEqual(result["language"], "typescript")
-
-            # Verify TypeScript-specific files
-            target_path = Path(result["path"])
-            self.assertTrue((target_path / "package.json").exists())
-            self.assertTrue((target_path / "tsconfig.json").exists())
-            self.assertTrue((target_path / "eslint.config.mjs").exists())
-            self.assertTrue((target_path / ".prettierrc.json").exists())
-            self.assertTrue((target_path / ".nvmrc").exists())
-            self.assertTrue((target_path / "vitest.config.ts").exists())
+        result = _shared_results["typescript"]
+        target_path = _shared_targets["typescript"]
+
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+        self.assertEqual(result["language"], "typescript")
+
+        # Verify TypeScript-specific files
+        expected = {
+            "package.json",
+            "tsconfig.json",
+            "eslint.config.mjs",
+            ".prettierrc.json",
+            ".nvmrc",
+            "vitest.config.ts",
+        }
+        self.assertEqual(expected - _list_files(target_path), set())
 
 
 class TestExecuteWithAgentStub(unittest.TestCase):
     """Test execute with agent stub."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_agent_stub(self, mock_commit, mock_git):
+    def test_creates_agent_stub(self):
         """Should create an agent stub when requested."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "stub-plugin")
-
-            context = {
-                "plugin_name": "stub-plugin",
-                "description": "A plugin with agent stub for testing",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-                "include_agent_stub": True,
-                "agent_stub_name": "my-agent",
-                "agent_stub_description": "A test agent for the plugin",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-
-            target_path = Path(result["path"])
-            self.assertTrue(
-                (target_path / "agents" / "my-agent" / "my-agent.md").exists()
-            )
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "stub-plugin")
+
+        context = {
+            **_BASE_CONTEXT,
+            "plugin_name": "stub-plugin",
+            "description": "A plugin with agent stub for testing",
+            "target_directory": str(target_path),
+            "include_agent_stub": True,
+            "agent_stub_name": "my-agent",
+            "agent_stub_description": "A test agent for the plugin",
+        }
+
+        result = execute(context)
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+
+        self.assertTrue(
+            (target_path / "agents" / "my-agent" / "my-agent.md").exists()
+        )
 
 
 class TestExecuteWithSkillStub(unittest.TestCase):
     """Test execute with skill stub."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_skill_stub(self, mock_commit, mock_git):
+    def test_creates_skill_stub(self):
         """Should create a skill stub when requested."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "skill-plugin")
-
-            context = {
-                "plugin_name": "skill-plugin",
-                "description": "A plugin with skill stub for testing",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-                "include_skill_stub": True,
-                "skill_stub_name": "my-skill",
-                "skill_stub_description": "A test skill for the plugin",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-
-            target_path = Path(result["path"])
-            self.assertTrue(
-                (target_path / "skills" / "my-skill" / "SKILL.md").exists()
-            )
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "skill-plugin")
+
+        context = {
+            **_BASE_CONTEXT,
+            "plugin_name": "skill-plugin",
+            "description": "A plugin with skill stub for testing",
+            "target_directory": str(target_path),
+            "include_skill_stub": True,
+            "skill_stub_name": "my-skill",
+            "skill_stub_description": "A test skill for the plugin",
+        }
 
+        result = execute(context)
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
 
-class TestExecuteValidation(unittest.TestCase):
-    """Test execute input validation."""
+        self.assertTrue(
+            (target_path / "skills" / "my-skill" / "SKILL.md").exists()
+        )
+
+
+class TestValidateContext(unittest.TestCase):
+    """Test scaffold context field validation.
+
+    Every case here fails before the target directory is checked, so
+    that check is stubbed and asserted unused to keep these tests
+    off the filesystem.
+    """
+
+    def setUp(self):
+        patcher = patch.object(_scaffold_mod, "validate_target_directory")
+        self.mock_validate_target = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.mock_validate_target.assert_not_called()
 
     def test_rejects_missing_name(self):
-        """Should reject execution without plugin_name."""
-        result = execute({})
-        self.assertFalse(result["success"])
-        self.assertIn("plugin_name", result["message"])
+        """Should reject a context without plugin_name."""
+        is_valid, error = validate_context({})
+        self.assertFalse(is_valid)
+        self.assertIn("plugin_name", error)
 
     def test_rejects_invalid_name(self):
         """Should reject plugin names that can't be auto-converted to valid kebab-case."""
         # "!!!" converts to empty string via to_kebab_case, which fails validation
-        result = execute({"plugin_name": "!!!", "description": "A valid description"})
-        self.assertFalse(result["success"])
-        self.assertIn("invalid plugin name", result["message"].lower())
+        is_valid, error = validate_context(
+            {"plugin_name": "!!!", "description": "A valid description"}
+        )
+        self.assertFalse(is_valid)
+        self.assertIn("invalid plugin name", error.lower())
 
     def test_auto_converts_name_to_kebab_case(self):
         """Should auto-convert names to kebab-case before validation."""
         # "Invalid Name!" should be auto-converted to "invalid-name" which is valid
-        result = execute({
+        is_valid, error = validate_context({
             "plugin_name": "Invalid Name!",
             "description": "Short",  # Will fail on description, not name
         })
         # This fails on description (too short), proving name was accepted
-        self.assertFalse(result["success"])
-        self.assertIn("description", result["message"].lower())
+        self.assertFalse(is_valid)
+        self.assertIn("description", error.lower())
 
     def test_rejects_invalid_description(self):
         """Should reject invalid descriptions."""
-        result = execute({"plugin_name": "valid-name", "description": "Short"})
-        self.assertFalse(result["success"])
-        self.assertIn("description", result["message"].lower())
+        is_valid, error = validate_context(
+            {"plugin_name": "valid-name", "description": "Short"}
+        )
+        self.assertFalse(is_valid)
+        self.assertIn("description", error.lower())
 
     def test_rejects_invalid_language(self):
         """Should reject unsupported languages."""
-        result = execute({
+        is_valid, error = validate_context({
             "plugin_name": "test-plugin",
             "description": "A valid description for testing",
             "language": "rust",
         })
-        self.assertFalse(result["success"])
-        self.assertIn("Unsupported language", result["message"])
+        self.assertFalse(is_valid)
+        self.assertIn("Unsupported language", error)
 
     def test_rejects_missing_author(self):
-        """Should reject execution without author_name."""
-        result = execute({
+        """Should reject a context without author_name."""
+        is_valid, error = validate_context({
             "plugin_name": "test-plugin",
             "description": "A valid description for testing",
         })
-        self.assertFalse(result["success"])
-        self.assertIn("author_name", result["message"])
+        self.assertFalse(is_valid)
+        self.assertIn("author_name", error)
 
     def test_rejects_missing_author_email(self):
-        """Should reject execution without author_email."""
-        result = execute({
+        """Should reject a context without author_email."""
+        is_valid, error = validate_context({
             "plugin_name": "test-plugin",
             "description": "A valid description for testing",
             "author_name": "Test",
         })
-        self.assertFalse(result["success"])
-        self.assertIn("author_email", result["message"])
+        self.assertFalse(is_valid)
+        self.assertIn("author_email", error)
+
+
+class TestValidateContextTargetDirectory(unittest.TestCase):
+    """Test scaffold context target directory validation."""
 
     def test_rejects_existing_non_empty_directory(self):
         """Should reject non-empty target directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "existing"
-            target.mkdir()
-            (target / "file.txt").write_text("content")
-
-            result = execute({
-                "plugin_name": "test-plugin",
-                "description": "A valid description for testing",
-                "target_directory": str(target),
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            })
-            self.assertFalse(result["success"])
-            self.assertIn("not empty", result["message"])
+        tmp = make_tmp(self)
+        target = Path(tmp) / "existing"
+        target.mkdir()
+        (target / "file.txt").write_text("content")
+
+        is_valid, error = validate_context({
+            "plugin_name": "test-plugin",
+            "description": "A valid description for testing",
+            "target_directory": str(target),
+            "author_name": "Test",
+            "author_email": "test@test.com",
+        })
+        self.assertFalse(is_valid)
+        self.assertIn("not empty", error)
+
+
+class TestExecuteValidation(unittest.TestCase):
+    """Test execute surfaces validation errors."""
+
+    def test_returns_validation_error(self):
+        """Should fail with the validator's message before scaffolding."""
+        result = execute({})
+        self.assertFalse(result["success"])
+        self.assertIn("plugin_name", result["message"])
 
 
 class TestExecuteGitInit(unittest.TestCase):
     """Test git initialization during scaffolding."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_git_init_creates_git_dir(self, mock_commit, mock_git):
+    def test_git_init_creates_git_dir(self):
         """Should report git initialization status."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "git-plugin")
-
-            context = {
-                "plugin_name": "git-plugin",
-                "description": "A plugin to test git init behavior",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"])
-            self.assertTrue(result["git_initialized"])
-            self.assertTrue(result["git_committed"])
+        result = _shared_results["python"]
+        self.assertTrue(result["success"])
+        self.assertTrue(result["git_initialized"])
+        self.assertTrue(result["git_committed"])
 
 
 class TestPythonVersionNormalization(unittest.TestCase):
     """Test python_version normalization to X.Y format."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_strips_patch_version(self, mock_commit, mock_git):
+    def test_strips_patch_version(self):
         """Should normalize 3.11.4 to 3.11 in pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "ver-plugin")
-
-            context = {
-                "plugin_name": "ver-plugin",
-                "description": "A plugin to test version normalization",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-                "python_version": "3.11.4",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-
-            # The .python-version file should have X.Y format
-            target_path = Path(result["path"])
-            py_version = (target_path / ".python-version").read_text().strip()
-            self.assertEqual(py_version, "3.11")
-
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_keeps_xy_format(self, mock_commit, mock_git):
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "ver-plugin")
+
+        context = {
+            **_BASE_CONTEXT,
+            "plugin_name": "ver-plugin",
+            "description": "A plugin to test version normalization",
+            "target_directory": str(target_path),
+            "python_version": "3.11.4",
+        }
+
+        result = execute(context)
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+
+        # The .python-version file should have X.Y format
+        py_version = (target_path / ".python-version").read_text().strip()
+        self.assertEqual(py_version, "3.11")
+
+    def test_keeps_xy_format(self):
         """Should leave 3.12 as-is."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "ver2-plugin")
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "ver2-plugin")
 
-            context = {
-                "plugin_name": "ver2-plugin",
-                "description": "A plugin to test version normalization",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-                "python_version": "3.12",
-            }
+        context = {
+            **_BASE_CONTEXT,
+            "plugin_name": "ver2-plugin",
+            "description": "A plugin to test version normalization",
+            "target_directory": str(target_path),
+            "python_version": "3.12",
+        }
 
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+        result = execute(context)
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
 
-            target_path = Path(result["path"])
-            py_version = (target_path / ".python-version").read_text().strip()
-            self.assertEqual(py_version, "3.12")
+        py_version = (target_path / ".python-version").read_text().strip()
+        self.assertEqual(py_version, "3.12")
 
 
 class TestExecuteTypescriptFiles(unittest.TestCase):
     """Test TypeScript scaffolding creates new files (index.ts, test, CI)."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_typescript_entry_point(self, mock_commit, mock_git):
+    def test_creates_typescript_entry_point(self):
         """Should create src/index.ts and tests/index.test.ts."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "ts-entry-plugin")
-
-            context = {
-                "plugin_name": "ts-entry-plugin",
-                "description": "A TypeScript plugin to test entry point files",
-                "license": "MIT",
-                "language": "typescript",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-
-            target_path = Path(result["path"])
-            self.assertTrue(
-                (target_path / "src" / "index.ts").exists(),
-                "src/index.ts should exist",
-            )
-            self.assertTrue(
-                (target_path / "tests" / "index.test.ts").exists(),
-                "tests/index.test.ts should exist",
-            )
-
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_ci_workflow(self, mock_commit, mock_git):
+        result = _shared_results["typescript"]
+        target_path = _shared_targets["typescript"]
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+
+        self.assertTrue(
+            (target_path / "src" / "index.ts").exists(),
+            "src/index.ts should exist",
+        )
+        self.assertTrue(
+            (target_path / "tests" / "index.test.ts").exists(),
+            "tests/index.test.ts should exist",
+        )
+
+    def test_creates_ci_workflow(self):
         """Should create .github/workflows/ci.yml for TypeScript."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "ts-ci-plugin")
-
-            context = {
-                "plugin_name": "ts-ci-plugin",
-                "description": "A TypeScript plugin to test CI workflow",
-                "license": "MIT",
-                "language": "typescript",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            }
-
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
+        result = _shared_results["typescript"]
+        target_path = _shared_targets["typescript"]
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
 
-            target_path = Path(result["path"])
-            ci_path = target_path / ".github" / "workflows" / "ci.yml"
-            self.assertTrue(ci_path.exists(), ".github/workflows/ci.yml should exist")
+        ci_path = target_path / ".github" / "workflows" / "ci.yml"
+        self.assertTrue(ci_path.exists(), ".github/workflows/ci.yml should exist")
 
-            # Verify it's a valid YAML-like file with expected content
-            ci_content = ci_path.read_text()
-            self.assertIn("name:", ci_content)
+        # Verify it's a valid YAML-like file with expected content
+        ci_content = ci_path.read_text()
+        self.assertIn("name:", ci_content)
 
 
 class TestExecutePythonCIWorkflow(unittest.TestCase):
     """Test Python scaffolding creates CI workflow."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_creates_ci_workflow(self, mock_commit, mock_git):
+    def test_creates_ci_workflow(self):
         """Should create .github/workflows/ci.yml for Python."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "py-ci-plugin")
+        result = _shared_results["python"]
+        target_path = _shared_targets["python"]
+        self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
 
-            context = {
-                "plugin_name": "py-ci-plugin",
-                "description": "A Python plugin to test CI workflow creation",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            }
+        ci_path = target_path / ".github" / "workflows" / "ci.yml"
+        self.assertTrue(ci_path.exists(), ".github/workflows/ci.yml should exist")
 
-            result = execute(context)
-            self.assertTrue(result["success"], f"Execute failed: {result.get('message')}")
-
-            target_path = Path(result["path"])
-            ci_path = target_path / ".github" / "workflows" / "ci.yml"
-            self.assertTrue(ci_path.exists(), ".github/workflows/ci.yml should exist")
-
-            ci_content = ci_path.read_text()
-            self.assertIn("name:", ci_content)
+        ci_content = ci_path.read_text()
+        self.assertIn("name:", ci_content)
 
 
 class TestPartialFailureResponse(unittest.TestCase):
     """Test that partial failure includes path and files_created."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
     @patch.object(_scaffold_mod, "render_typescript_files", side_effect=RuntimeError("Template error"))
-    def test_includes_path_and_files_on_failure(self, mock_ts, mock_commit, mock_git):
+    def test_includes_path_and_files_on_failure(self, mock_ts):
         """Should include path and files_created in error response."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "fail-plugin")
-
-            context = {
-                "plugin_name": "fail-plugin",
-                "description": "A plugin that will fail during scaffolding",
-                "license": "MIT",
-                "language": "typescript",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            }
-
-            result = execute(context)
-            self.assertFalse(result["success"])
-            self.assertIn("path", result)
-            self.assertIn("files_created", result)
-            self.assertIn("error_type", result)
-            self.assertEqual(result["error_type"], "RuntimeError")
-            # Some shared files should have been created before failure
-            self.assertIsInstance(result["files_created"], list)
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "fail-plugin")
+
+        context = {
+            **_BASE_CONTEXT,
+            "plugin_name": "fail-plugin",
+            "description": "A plugin that will fail during scaffolding",
+            "language": "typescript",
+            "target_directory": str(target_path),
+        }
+
+        result = execute(context)
+        self.assertFalse(result["success"])
+        self.assertIn("path", result)
+        self.assertIn("files_created", result)
+        self.assertIn("error_type", result)
+        self.assertEqual(result["error_type"], "RuntimeError")
+        # Some shared files should have been created before failure
+        self.assertIsInstance(result["files_created"], list)
 
 
 class TestExecuteLicensesDirectory(unittest.TestCase):
     """Test that LICENSES/<id>.txt is emitted for SPDX licenses but skipped for UNLICENSED."""
 
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_writes_licenses_dir_for_spdx_license(self, mock_commit, mock_git):
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "spdx-plugin")
-            result = execute({
-                "plugin_name": "spdx-plugin",
-                "description": "An SPDX-licensed plugin for testing",
-                "license": "MIT",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            })
-            self.assertTrue(result["success"], result.get("message"))
-            target_path = Path(result["path"])
-            self.assertTrue(
-                (target_path / "LICENSES" / "MIT.txt").exists(),
-                "LICENSES/MIT.txt should exist for an MIT-licensed scaffold",
-            )
-
-    @patch.object(_scaffold_mod, "initialize_git", return_value=True)
-    @patch.object(_scaffold_mod, "create_initial_commit", return_value=True)
-    def test_skips_licenses_dir_for_unlicensed(self, mock_commit, mock_git):
-        with tempfile.TemporaryDirectory() as tmp:
-            target = str(Path(tmp) / "proprietary-plugin")
-            result = execute({
-                "plugin_name": "proprietary-plugin",
-                "description": "A proprietary plugin for testing",
-                "license": "UNLICENSED",
-                "language": "python",
-                "target_directory": target,
-                "author_name": "Test",
-                "author_email": "test@test.com",
-            })
-            self.assertTrue(result["success"], result.get("message"))
-            target_path = Path(result["path"])
-            self.assertFalse(
-                (target_path / "LICENSES").exists(),
-                "LICENSES/ should not be emitted for UNLICENSED scaffolds",
-            )
-            # LICENSE at root still exists for GitHub display
-            self.assertTrue((target_path / "LICENSE").exists())
+    def test_writes_licenses_dir_for_spdx_license(self):
+        result = _shared_results["python"]
+        target_path = _shared_targets["python"]
+        self.assertTrue(result["success"], result.get("message"))
+        self.assertTrue(
+            (target_path / "LICENSES" / "MIT.txt").exists(),
+            "LICENSES/MIT.txt should exist for an MIT-licensed scaffold",
+        )
+
+    def test_skips_licenses_dir_for_unlicensed(self):
+        tmp = make_tmp(self)
+        target_path = Path(tmp, "proprietary-plugin")
+        result = execute({
+            **_BASE_CONTEXT,
+            "plugin_name": "proprietary-plugin",
+            "description": "A proprietary plugin for testing",
+            "license": "UNLICENSED",
+            "target_directory": str(target_path),
+        })
+        self.assertTrue(result["success"], result.get("message"))
+        self.assertFalse(
+            (target_path / "LICENSES").exists(),
+            "LICENSES/ should not be emitted for UNLICENSED scaffolds",
+        )
+        # LICENSE at root still exists for GitHub display
+        self.assertTrue((target_path / "LICENSE").exists())
 
 
 if __name__ == "__main__":
@@ -4,23 +4,18 @@
 """Unit tests for plugin-manager context operations."""
 
 import os
-import sys
-import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = _project_root / "skills" / "plugin-manager" / "scripts"
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
+from _scaffold_bootstrap import (
+    make_tmp,
+    prepare_plugin_manager_imports,
+    snapshot_operations,
+)
 
-# Clear cached operations modules to avoid cross-manager conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith("operations."):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+prepare_plugin_manager_imports()
 
 import operations.scaffold_ops.context as _context_mod  # noqa: E402
 
@@ -31,10 +26,7 @@ from operations.scaffold_ops.context import (  # noqa: E402
     resolve_default_target,
 )
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+_ops_snapshot = snapshot_operations()
 
 
 class TestInferGitConfig(unittest.TestCase):
@@ -44,13 +36,8 @@ class TestInferGitConfig(unittest.TestCase):
     def test_success(self, mock_run):
         """Should return name and email from git config."""
         def side_effect(cmd, **kwargs):
-            result = MagicMock()
-            result.returncode = 0
-            if "user.name" in cmd:
-                result.stdout = "Test User\n"
-            elif "user.email" in cmd:
-                result.stdout = "test@example.com\n"
-            return result
+            stdout = "Test User\n" if "user.name" in cmd else "test@example.com\n"
+            return SimpleNamespace(returncode=0, stdout=stdout)
 
         mock_run.side_effect = side_effect
         config = infer_git_config()
@@ -69,14 +56,9 @@ class TestInferGitConfig(unittest.TestCase):
     def test_partial_failure(self, mock_run):
         """Should return partial results if one config fails."""
         def side_effect(cmd, **kwargs):
-            result = MagicMock()
             if "user.name" in cmd:
-                result.returncode = 0
-                result.stdout = "Test User\n"
-            else:
-                result.returncode = 1
-                result.stdout = ""
-            return result
+                return SimpleNamespace(returncode=0, stdout="Test User\n")
+            return SimpleNamespace(returncode=1, stdout="")
 
         mock_run.side_effect = side_effect
         config = infer_git_config()
@@ -89,37 +71,37 @@ class TestValidateTargetDirectory(unittest.TestCase):
 
     def test_new_directory(self):
         """Should accept a non-existent directory under an existing parent."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = os.path.join(tmp, "new-plugin")
-            is_valid, error = validate_target_directory(target)
-            self.assertTrue(is_valid, f"Should be valid: {error}")
+        tmp = make_tmp(self)
+        target = os.path.join(tmp, "new-plugin")
+        is_valid, error = validate_target_directory(target)
+        self.assertTrue(is_valid, f"Should be valid: {error}")
 
     def test_existing_empty_directory(self):
         """Should accept an existing empty directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = os.path.join(tmp, "empty-dir")
-            os.makedirs(target)
-            is_valid, error = validate_target_directory(target)
-            self.assertTrue(is_valid, f"Should be valid: {error}")
+        tmp = make_tmp(self)
+        target = os.path.join(tmp, "empty-dir")
+        os.makedirs(target)
+        is_valid, error = validate_target_directory(target)
+        self.assertTrue(is_valid, f"Should be valid: {error}")
 
     def test_existing_non_empty_directory(self):
         """Should reject a non-empty directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = os.path.join(tmp, "non-empty")
-            os.makedirs(target)
-            Path(os.path.join(target, "file.txt")).write_text("content")
-            is_valid, error = validate_target_directory(target)
-            self.assertFalse(is_valid)
-            self.assertIn("not empty", error)
+        tmp = make_tmp(self)
+        target = os.path.join(tmp, "non-empty")
+        os.makedirs(target)
+        Path(os.path.join(target, "file.txt")).write_text("content")
+        is_valid, error = validate_target_directory(target)
+        self.assertFalse(is_valid)
+        self.assertIn("not empty", error)
 
     def test_existing_file(self):
         """Should reject if target is a file."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = os.path.join(tmp, "file.txt")
-            Path(target).write_text("content")
-            is_valid, error = validate_target_directory(target)
-            self.assertFalse(is_valid)
-            self.assertIn("existing file", error)
+        tmp = make_tmp(self)
+        target = os.path.join(tmp, "file.txt")
+        Path(target).write_text("content")
+        is_valid, error = validate_target_directory(target)
+        self.assertFalse(is_valid)
+        self.assertIn("existing file", error)
 
     def test_empty_path(self):
         """Should reject empty path."""
@@ -133,16 +115,14 @@ class TestValidateTargetDirectory(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("Parent directory does not exist", error)
 
-    def test_rejects_symlink(self):
+    @patch.object(_context_mod.Path, "is_symlink", return_value=True)
+    def test_rejects_symlink(self, mock_is_symlink):
         """Should reject a symlink target to prevent writing through unexpected paths."""
-        with tempfile.TemporaryDirectory() as tmp:
-            real_dir = os.path.join(tmp, "real-dir")
-            os.makedirs(real_dir)
-            link_path = os.path.join(tmp, "link-dir")
-            os.symlink(real_dir, link_path)
-            is_valid, error = validate_target_directory(link_path)
-            self.assertFalse(is_valid)
-            self.assertIn("symbolic link", error)
+        # Mocked so the test runs on filesystems that restrict symlink creation
+        is_valid, error = validate_target_directory("/some/link-dir")
+        self.assertFalse(is_valid)
+        self.assertIn("symbolic link", error)
+        mock_is_symlink.assert_called_once()
 
 
 class TestCheckGhAvailable(unittest.TestCase):
@@ -151,7 +131,7 @@ class TestCheckGhAvailable(unittest.TestCase):
     @patch.object(_context_mod.subprocess, "run")
     def test_available(self, mock_run):
         """Should return True when gh is available."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = SimpleNamespace(returncode=0)
         self.assertTrue(check_gh_available())
 
     @patch.object(_context_mod.subprocess, "run")
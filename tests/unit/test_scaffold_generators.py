@@ -3,23 +3,22 @@
 
 """Unit tests for plugin-manager generator operations."""
 
-import sys
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = _project_root / "skills" / "plugin-manager" / "scripts"
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from _scaffold_bootstrap import (
+    SCAFFOLD_TEMPLATES as TEMPLATES_DIR,
+    SCRATCH_DIR,
+    prepare_plugin_manager_imports,
+    snapshot_operations,
+)
 
-# Clear cached operations modules to avoid cross-manager conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith("operations."):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+prepare_plugin_manager_imports()
 
 import operations.scaffold_ops.generators as _generators_mod  # noqa: E402
 
@@ -32,73 +31,125 @@ from operations.scaffold_ops.generators import (  # noqa: E402
     create_initial_commit,
 )
 
-TEMPLATES_DIR = _project_root / "skills" / "plugin-manager" / "templates" / "scaffold"
+_ops_snapshot = snapshot_operations()
+
+# Stand-ins for ``subprocess.run`` results; only ``returncode`` is read
+_OK = SimpleNamespace(returncode=0)
+_FAIL = SimpleNamespace(returncode=1)
+
+
+def _entries(root, *subdirs, dirs_only=False):
+    """Return entry names under ``root`` and the given subdirectories.
+
+    Names in a subdirectory are prefixed with it (``"a/b"``), so one
+    ``scandir`` per directory replaces an ``exists()`` call per path.
+    With ``dirs_only``, only directories are included.
+    """
+    names = set()
+    for sub in ("",) + subdirs:
+        path = root / sub if sub else root
+        if path.is_dir():
+            names.update(
+                f"{sub}/{entry.name}" if sub else entry.name
+                for entry in os.scandir(path)
+                if not dirs_only or entry.is_dir()
+            )
+    return names
+
+
+class _ClassTempDirTestCase(unittest.TestCase):
+    """TestCase whose tests share one temp root per class.
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+    Each test still gets its own directory via ``make_target()``, but
+    the root is created and removed once per class rather than a
+    fresh ``TemporaryDirectory`` per test.
+    """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._root = tempfile.mkdtemp(dir=SCRATCH_DIR)
 
-class TestCreateDirectoryStructure(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root, ignore_errors=True)
+        super().tearDownClass()
+
+    @classmethod
+    def make_target(cls):
+        """Return a fresh, empty directory under the class root."""
+        return Path(tempfile.mkdtemp(dir=cls._root))
+
+
+class TestCreateDirectoryStructure(_ClassTempDirTestCase):
     """Test directory structure creation."""
 
     def test_python_structure(self):
         """Should create Python-specific directories."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            created = create_directory_structure(target, "python")
-            self.assertIn(".claude-plugin", created)
-            self.assertIn(".github/workflows", created)
-            self.assertIn("agents", created)
-            self.assertIn("skills", created)
-            self.assertIn("scripts", created)
-            self.assertIn("tests", created)
-            self.assertIn("docs", created)
-            # Verify directories actually exist
-            self.assertTrue((target / ".claude-plugin").is_dir())
-            self.assertTrue((target / "scripts").is_dir())
-            self.assertTrue((target / "tests").is_dir())
-            self.assertTrue((target / ".github" / "workflows").is_dir())
+        target = self.make_target()
+        created = create_directory_structure(target, "python")
+        self.assertIn(".claude-plugin", created)
+        self.assertIn(".github/workflows", created)
+        self.assertIn("agents", created)
+        self.assertIn("skills", created)
+        self.assertIn("scripts", created)
+        self.assertIn("tests", created)
+        self.assertIn("docs", created)
+        # Verify directories actually exist
+        present = _entries(target, ".github", dirs_only=True)
+        for d in (".claude-plugin", "scripts", "tests", ".github/workflows"):
+            self.assertIn(d, present)
 
     def test_typescript_structure(self):
         """Should create TypeScript-specific directories."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            created = create_directory_structure(target, "typescript")
-            self.assertIn(".claude-plugin", created)
-            self.assertIn(".github/workflows", created)
-            self.assertIn("agents", created)
-            self.assertIn("skills", created)
-            self.assertIn("src", created)
-            self.assertIn("tests", created)
-            self.assertIn("docs", created)
-            # Verify directories actually exist
-            self.assertTrue((target / ".claude-plugin").is_dir())
-            self.assertTrue((target / "src").is_dir())
-            self.assertTrue((target / "tests").is_dir())
-            self.assertTrue((target / ".github" / "workflows").is_dir())
+        target = self.make_target()
+        created = create_directory_structure(target, "typescript")
+        self.assertIn(".claude-plugin", created)
+        self.assertIn(".github/workflows", created)
+        self.assertIn("agents", created)
+        self.assertIn("skills", created)
+        self.assertIn("src", created)
+        self.assertIn("tests", created)
+        self.assertIn("docs", created)
+        # Verify directories actually exist
+        present = _entries(target, ".github", dirs_only=True)
+        for d in (".claude-plugin", "src", "tests", ".github/workflows"):
+            self.assertIn(d, present)
 
     def test_python_does_not_create_src(self):
         """Python should not create src/ directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            created = create_directory_structure(target, "python")
-            self.assertNotIn("src", created)
+        target = self.make_target()
+        created = create_directory_structure(target, "python")
+        self.assertNotIn("src", created)
 
     def test_typescript_does_not_create_scripts(self):
         """TypeScript should not create scripts/ directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            created = create_directory_structure(target, "typescript")
-            self.assertNotIn("scripts", created)
+        target = self.make_target()
+        created = create_directory_structure(target, "typescript")
+        self.assertNotIn("scripts", created)
 
 
-class TestRenderSharedFiles(unittest.TestCase):
+class TestRenderSharedFiles(_ClassTempDirTestCase):
     """Test shared file rendering."""
     # REUSE-IgnoreStart — assertions reference literal SPDX strings.
 
-    def _build_variables(self, **overrides):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Render each license variant once; tests only read the output
+        cls.target = cls.make_target()
+        cls.created = render_shared_files(
+            cls.target, cls._build_variables(), TEMPLATES_DIR
+        )
+        cls.unlicensed_target = cls.make_target()
+        cls.unlicensed_created = render_shared_files(
+            cls.unlicensed_target,
+            cls._build_variables(license_id="UNLICENSED"),
+            TEMPLATES_DIR,
+        )
+
+    @staticmethod
+    def _build_variables(**overrides):
         from operations.shared import build_template_variables
         context = {
             "plugin_name": "test-plugin",
@@ -120,251 +171,236 @@ class TestRenderSharedFiles(unittest.TestCase):
 
     def test_produces_expected_files(self):
         """Should render all shared template files."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            target.mkdir(exist_ok=True)
-
-            created = render_shared_files(
-                target, self._build_variables(), TEMPLATES_DIR
-            )
-
-            expected_files = [
-                ".claude-plugin/plugin.json",
-                ".claude-plugin/marketplace.json",
-                ".claude-plugin/aida-config.json",
-                "CLAUDE.md",
-                "README.md",
-                ".markdownlint.json",
-                ".yamllint.yml",
-                ".frontmatter-schema.json",
-                "AUTHORS",
-                "REUSE.toml",
-            ]
-
-            for f in expected_files:
-                self.assertIn(f, created, f"Missing file: {f}")
-                self.assertTrue((target / f).exists(), f"File not created: {f}")
+        expected_files = [
+            ".claude-plugin/plugin.json",
+            ".claude-plugin/marketplace.json",
+            ".claude-plugin/aida-config.json",
+            "CLAUDE.md",
+            "README.md",
+            ".markdownlint.json",
+            ".yamllint.yml",
+            ".frontmatter-schema.json",
+            "AUTHORS",
+            "REUSE.toml",
+        ]
+
+        present = _entries(self.target, ".claude-plugin")
+        for f in expected_files:
+            self.assertIn(f, self.created, f"Missing file: {f}")
+            self.assertIn(f, present, f"File not created: {f}")
 
     def test_emits_spdx_headers_in_markdown(self):
         """Markdown files (README, CLAUDE.md) carry SPDX headers."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            render_shared_files(
-                target, self._build_variables(), TEMPLATES_DIR
+        for fname in ("README.md", "CLAUDE.md"):
+            content = (self.target / fname).read_text()
+            self.assertIn(
+                "SPDX-FileCopyrightText: 2026", content,
+                f"{fname} missing copyright header",
+            )
+            self.assertIn(
+                "SPDX-License-Identifier: MIT", content,
+                f"{fname} missing license header",
             )
-            for fname in ("README.md", "CLAUDE.md"):
-                content = (target / fname).read_text()
-                self.assertIn(
-                    "SPDX-FileCopyrightText: 2026", content,
-                    f"{fname} missing copyright header",
-                )
-                self.assertIn(
-                    "SPDX-License-Identifier: MIT", content,
-                    f"{fname} missing license header",
-                )
 
     def test_emits_spdx_headers_in_yaml(self):
         """yamllint config carries an SPDX header in hash style."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            render_shared_files(
-                target, self._build_variables(), TEMPLATES_DIR
-            )
-            content = (target / ".yamllint.yml").read_text()
-            self.assertIn("# SPDX-FileCopyrightText:", content)
-            self.assertIn("# SPDX-License-Identifier: MIT", content)
+        content = (self.target / ".yamllint.yml").read_text()
+        self.assertIn("# SPDX-FileCopyrightText:", content)
+        self.assertIn("# SPDX-License-Identifier: MIT", content)
 
     def test_authors_file_lists_initial_author(self):
         """Generated AUTHORS file names the scaffolding author."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            render_shared_files(
-                target, self._build_variables(), TEMPLATES_DIR
-            )
-            content = (target / "AUTHORS").read_text()
-            self.assertIn("Test Author", content)
-            self.assertIn("test@example.com", content)
+        content = (self.target / "AUTHORS").read_text()
+        self.assertIn("Test Author", content)
+        self.assertIn("test@example.com", content)
 
     def test_reuse_toml_skips_json(self):
         """REUSE.toml lists JSON in the skip-with-attribution annotations."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            render_shared_files(
-                target, self._build_variables(), TEMPLATES_DIR
-            )
-            content = (target / "REUSE.toml").read_text()
-            self.assertIn("**.json", content)
-            self.assertIn("MIT", content)
+        content = (self.target / "REUSE.toml").read_text()
+        self.assertIn("**.json", content)
+        self.assertIn("MIT", content)
 
     def test_unlicensed_skips_spdx_license_line(self):
         """For UNLICENSED, copyright-text appears but license-id is suppressed."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            variables = self._build_variables(license_id="UNLICENSED")
-            render_shared_files(target, variables, TEMPLATES_DIR)
-            content = (target / "README.md").read_text()
-            self.assertIn("SPDX-FileCopyrightText:", content)
-            # UNLICENSED is not an SPDX identifier; skip the line.
-            self.assertNotIn(
-                "SPDX-License-Identifier: UNLICENSED", content,
-            )
+        content = (self.unlicensed_target / "README.md").read_text()
+        self.assertIn("SPDX-FileCopyrightText:", content)
+        # UNLICENSED is not an SPDX identifier; skip the line.
+        self.assertNotIn(
+            "SPDX-License-Identifier: UNLICENSED", content,
+        )
 
     def test_unlicensed_skips_reuse_toml(self):
         """UNLICENSED has no SPDX id, so REUSE.toml would just emit noise."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            variables = self._build_variables(license_id="UNLICENSED")
-            created = render_shared_files(
-                target, variables, TEMPLATES_DIR
-            )
-            self.assertNotIn("REUSE.toml", created)
-            self.assertFalse((target / "REUSE.toml").exists())
+        self.assertNotIn("REUSE.toml", self.unlicensed_created)
+        self.assertFalse((self.unlicensed_target / "REUSE.toml").exists())
     # REUSE-IgnoreEnd
 
 
-class TestAssembleGitignore(unittest.TestCase):
+class TestAssembleGitignore(_ClassTempDirTestCase):
     """Test .gitignore assembly."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.content = {}
+        for language in ("python", "typescript"):
+            target = cls.make_target()
+            assemble_gitignore(target, language, TEMPLATES_DIR)
+            cls.content[language] = (target / ".gitignore").read_text()
+
     def test_python_gitignore(self):
         """Python gitignore should include Python-specific patterns."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            assemble_gitignore(target, "python", TEMPLATES_DIR)
-            content = (target / ".gitignore").read_text()
-            self.assertIn("__pycache__", content)
-            self.assertIn(".DS_Store", content)
-            self.assertNotIn("node_modules", content)
+        content = self.content["python"]
+        self.assertIn("__pycache__", content)
+        self.assertIn(".DS_Store", content)
+        self.assertNotIn("node_modules", content)
 
     def test_typescript_gitignore(self):
         """TypeScript gitignore should include Node-specific patterns."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            assemble_gitignore(target, "typescript", TEMPLATES_DIR)
-            content = (target / ".gitignore").read_text()
-            self.assertIn("node_modules", content)
-            self.assertIn(".DS_Store", content)
-            self.assertNotIn("__pycache__", content)
+        content = self.content["typescript"]
+        self.assertIn("node_modules", content)
+        self.assertIn(".DS_Store", content)
+        self.assertNotIn("__pycache__", content)
 
     def test_gitignore_differs_by_language(self):
         """Python and TypeScript gitignores should differ."""
-        with tempfile.TemporaryDirectory() as tmp:
-            py_target = Path(tmp) / "python"
-            py_target.mkdir()
-            ts_target = Path(tmp) / "typescript"
-            ts_target.mkdir()
-
-            assemble_gitignore(py_target, "python", TEMPLATES_DIR)
-            assemble_gitignore(ts_target, "typescript", TEMPLATES_DIR)
-
-            py_content = (py_target / ".gitignore").read_text()
-            ts_content = (ts_target / ".gitignore").read_text()
-
-            self.assertNotEqual(py_content, ts_content)
-
-
-class TestAssembleMakefile(unittest.TestCase):
+        self.assertNotEqual(self.content["python"], self.content["typescript"])
+
+    def test_matches_jinja_render(self):
+        """Reading the markup-free fragments must match a full Jinja render."""
+        from shared.utils import render_template
+        shared = render_template(
+            TEMPLATES_DIR, "shared/gitignore-shared.jinja2", {}
+        )
+        for language, fragment in (
+            ("python", "python/gitignore-python.jinja2"),
+            ("typescript", "typescript/gitignore-node.jinja2"),
+        ):
+            expected = "\n".join(
+                [shared, render_template(TEMPLATES_DIR, fragment, {})]
+            )
+            self.assertEqual(self.content[language], expected)
+
+    def test_templated_fragment_still_rendered(self):
+        """Fragments containing Jinja markup go through the renderer."""
+        templates = self.make_target()
+        for name, text in (
+            ("shared/gitignore-shared.jinja2", "{# comment #}.env\n"),
+            ("python/gitignore-python.jinja2", "{{ 'dist' }}/\n"),
+        ):
+            (templates / name).parent.mkdir(parents=True)
+            (templates / name).write_text(text)
+        target = self.make_target()
+        assemble_gitignore(target, "python", templates)
+        content = (target / ".gitignore").read_text()
+        self.assertEqual(content, ".env\n\ndist/\n")
+
+
+class TestAssembleMakefile(_ClassTempDirTestCase):
     """Test Makefile assembly."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        variables = {
+            "plugin_name": "test-plugin",
+            "plugin_display_name": "Test Plugin",
+        }
+        cls.content = {}
+        for language in ("python", "typescript"):
+            target = cls.make_target()
+            assemble_makefile(target, language, variables, TEMPLATES_DIR)
+            cls.content[language] = (target / "Makefile").read_text()
+
     def test_python_makefile(self):
         """Python Makefile should include ruff and pytest targets."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            variables = {
-                "plugin_name": "test-plugin",
-                "plugin_display_name": "Test Plugin",
-            }
-            assemble_makefile(target, "python", variables, TEMPLATES_DIR)
-            content = (target / "Makefile").read_text()
-            self.assertIn("ruff", content)
-            self.assertIn("pytest", content)
+        content = self.content["python"]
+        self.assertIn("ruff", content)
+        self.assertIn("pytest", content)
 
     def test_typescript_makefile(self):
         """TypeScript Makefile should include eslint and vitest targets."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp)
-            variables = {
-                "plugin_name": "test-plugin",
-                "plugin_display_name": "Test Plugin",
-            }
-            assemble_makefile(target, "typescript", variables, TEMPLATES_DIR)
-            content = (target / "Makefile").read_text()
-            self.assertIn("lint", content)
-            self.assertIn("vitest", content)
+        content = self.content["typescript"]
+        self.assertIn("lint", content)
+        self.assertIn("vitest", content)
 
     def test_makefile_differs_by_language(self):
         """Python and TypeScript Makefiles should differ."""
-        with tempfile.TemporaryDirectory() as tmp:
-            py_target = Path(tmp) / "python"
-            py_target.mkdir()
-            ts_target = Path(tmp) / "typescript"
-            ts_target.mkdir()
+        self.assertNotEqual(self.content["python"], self.content["typescript"])
 
-            variables = {
-                "plugin_name": "test-plugin",
-                "plugin_display_name": "Test Plugin",
-            }
 
-            assemble_makefile(py_target, "python", variables, TEMPLATES_DIR)
-            assemble_makefile(ts_target, "typescript", variables, TEMPLATES_DIR)
+class _StubRun:
+    """Plain ``subprocess.run`` stand-in that records its calls.
 
-            py_content = (py_target / "Makefile").read_text()
-            ts_content = (ts_target / "Makefile").read_text()
+    Results are returned in order, with the last one repeated; an
+    exception instance is raised instead of returned.
+    """
 
-            self.assertNotEqual(py_content, ts_content)
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if len(self.results) > 1:
+            result = self.results.pop(0)
+        else:
+            result = self.results[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
 
 
 class TestInitializeGit(unittest.TestCase):
     """Test git initialization."""
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_success(self, mock_run):
+    def test_success(self):
         """Should return True on successful git init."""
-        mock_run.return_value = MagicMock(returncode=0)
-        with tempfile.TemporaryDirectory() as tmp:
-            result = initialize_git(Path(tmp))
-            self.assertTrue(result)
+        run = _StubRun(_OK)
+        result = initialize_git(Path("/tmp/test"), runner=run)
+        self.assertTrue(result)
+        self.assertEqual(run.calls[0][1]["cwd"], Path("/tmp/test"))
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_failure(self, mock_run):
+    def test_failure(self):
         """Should return False when git is not available."""
-        mock_run.side_effect = FileNotFoundError("git not found")
-        with tempfile.TemporaryDirectory() as tmp:
-            result = initialize_git(Path(tmp))
-            self.assertFalse(result)
+        run = _StubRun(FileNotFoundError("git not found"))
+        result = initialize_git(Path("/tmp/test"), runner=run)
+        self.assertFalse(result)
+
+    @patch.object(_generators_mod.subprocess, "run", return_value=_OK)
+    def test_defaults_to_subprocess_run(self, mock_run):
+        """Without a runner, git is invoked through subprocess.run."""
+        self.assertTrue(initialize_git(Path("/tmp/test")))
+        mock_run.assert_called_once()
 
 
 class TestCreateInitialCommit(unittest.TestCase):
     """Test initial commit creation."""
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_success(self, mock_run):
+    def test_success(self):
         """Should return True when both add and commit succeed."""
-        mock_run.return_value = MagicMock(returncode=0)
-        result = create_initial_commit(Path("/tmp/test"))
+        run = _StubRun(_OK)
+        result = create_initial_commit(Path("/tmp/test"), runner=run)
         self.assertTrue(result)
-        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(len(run.calls), 2)
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_failure_on_add(self, mock_run):
+    def test_failure_on_add(self):
         """Should return False when git add fails."""
-        mock_run.return_value = MagicMock(returncode=1)
-        result = create_initial_commit(Path("/tmp/test"))
+        run = _StubRun(_FAIL)
+        result = create_initial_commit(Path("/tmp/test"), runner=run)
         self.assertFalse(result)
+        self.assertEqual(len(run.calls), 1)
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_failure_on_commit(self, mock_run):
+    def test_failure_on_commit(self):
         """Should return False when git commit fails after add succeeds."""
-        add_result = MagicMock(returncode=0)
-        commit_result = MagicMock(returncode=1)
-        mock_run.side_effect = [add_result, commit_result]
-        result = create_initial_commit(Path("/tmp/test"))
+        run = _StubRun(_OK, _FAIL)
+        result = create_initial_commit(Path("/tmp/test"), runner=run)
         self.assertFalse(result)
 
-    @patch.object(_generators_mod.subprocess, "run")
-    def test_failure_on_file_not_found(self, mock_run):
+    def test_failure_on_file_not_found(self):
         """Should return False when git is not available."""
-        mock_run.side_effect = FileNotFoundError("git not found")
-        result = create_initial_commit(Path("/tmp/test"))
+        run = _StubRun(FileNotFoundError("git not found"))
+        result = create_initial_commit(Path("/tmp/test"), runner=run)
         self.assertFalse(result)
 
 
@@ -3,21 +3,14 @@
 
 """Unit tests for plugin-manager license operations."""
 
-import sys
 import unittest
-from pathlib import Path
 
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = _project_root / "skills" / "plugin-manager" / "scripts"
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
+from _scaffold_bootstrap import (
+    prepare_plugin_manager_imports,
+    snapshot_operations,
+)
 
-# Clear cached operations modules to avoid cross-manager conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith("operations."):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+prepare_plugin_manager_imports()
 
 from operations.scaffold_ops.licenses import (  # noqa: E402
     get_license_text,
@@ -25,47 +18,56 @@ from operations.scaffold_ops.licenses import (  # noqa: E402
     SUPPORTED_LICENSES,
 )
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+_ops_snapshot = snapshot_operations()
+
+_SUPPORTED_SET = frozenset(SUPPORTED_LICENSES)
+_LICENSES_SET = frozenset(LICENSES)
+_EXPECTED_COUNT = 6
 
 
 class TestGetLicenseText(unittest.TestCase):
     """Test license text generation."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Render each license once; the per-license tests only read it
+        cls.rendered = {
+            license_id: get_license_text(license_id, "2026", "Test Author")
+            for license_id in SUPPORTED_LICENSES
+        }
+
     def test_mit_license(self):
-        text = get_license_text("MIT", "2026", "Test Author")
+        text = self.rendered["MIT"]
         self.assertIn("MIT License", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
 
     def test_apache_license(self):
-        text = get_license_text("Apache-2.0", "2026", "Test Author")
+        text = self.rendered["Apache-2.0"]
         self.assertIn("Apache License", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
 
     def test_isc_license(self):
-        text = get_license_text("ISC", "2026", "Test Author")
+        text = self.rendered["ISC"]
         self.assertIn("ISC License", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
 
     def test_gpl_license(self):
-        text = get_license_text("GPL-3.0", "2026", "Test Author")
+        text = self.rendered["GPL-3.0"]
         self.assertIn("GNU GENERAL PUBLIC LICENSE", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
 
     def test_agpl_license(self):
-        text = get_license_text("AGPL-3.0", "2026", "Test Author")
+        text = self.rendered["AGPL-3.0"]
         self.assertIn("GNU AFFERO GENERAL PUBLIC LICENSE", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
 
     def test_unlicensed(self):
-        text = get_license_text("UNLICENSED", "2026", "Test Author")
+        text = self.rendered["UNLICENSED"]
         self.assertIn("All rights reserved", text)
         self.assertIn("2026", text)
         self.assertIn("Test Author", text)
@@ -73,10 +75,11 @@ class TestGetLicenseText(unittest.TestCase):
     def test_all_supported_licenses(self):
         """Every supported license should render without error."""
         for license_id in SUPPORTED_LICENSES:
-            text = get_license_text(license_id, "2026", "Author")
-            self.assertTrue(len(text) > 0, f"License {license_id} produced empty text")
-            self.assertIn("2026", text)
-            self.assertIn("Author", text)
+            with self.subTest(license_id=license_id):
+                text = self.rendered[license_id]
+                self.assertTrue(len(text) > 0, "License produced empty text")
+                self.assertIn("2026", text)
+                self.assertIn("Test Author", text)
 
     def test_year_author_substitution(self):
         """Year and author should be properly substituted."""
@@ -95,11 +98,11 @@ class TestGetLicenseText(unittest.TestCase):
 
     def test_supported_licenses_list(self):
         """SUPPORTED_LICENSES should match LICENSES dict keys."""
-        self.assertEqual(set(SUPPORTED_LICENSES), set(LICENSES.keys()))
+        self.assertEqual(_SUPPORTED_SET, _LICENSES_SET)
 
     def test_licenses_count(self):
         """Should have exactly 6 supported licenses."""
-        self.assertEqual(len(SUPPORTED_LICENSES), 6)
+        self.assertEqual(len(SUPPORTED_LICENSES), _EXPECTED_COUNT)
 
     def test_format_string_injection_safe(self):
         """Author names with format-like patterns should not cause errors."""
@@ -8,12 +8,15 @@ very long inputs, and other security-sensitive edge cases.
 """
 
 import json
+import shutil
 import sys
 import tempfile
 import unittest
+from itertools import islice
 from pathlib import Path
 
 # Add scripts directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 sys.path.insert(
     0,
     str(
@@ -33,24 +36,14 @@ sys.path.insert(
     ),
 )
 
-import shutil
-
 from memento import _ensure_within_dir
 from rule_validation import validate_rules
+from shared.utils import MAX_JSON_DEPTH, safe_json_load
 
 
 class TestPathTraversalAttempts(unittest.TestCase):
     """Test protection against path traversal attacks."""
 
-    def setUp(self):
-        """Set up temporary directory for tests."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_path_normalization_prevents_traversal(self):
         """Test that path normalization prevents directory traversal."""
         # Test various path traversal attempts
@@ -60,17 +53,18 @@ class TestPathTraversalAttempts(unittest.TestCase):
             "..\\..\\windows\\system32",
         ]
 
+        base_path = Path.cwd().resolve()
         for dangerous in dangerous_paths:
-            # Resolve path and verify it stays within bounds
-            # This is what should be done in production code
-            normalized = Path(dangerous).resolve()
-            base_path = Path.cwd().resolve()
+            with self.subTest(path=dangerous):
+                # Resolve path and verify it stays within bounds
+                # This is what should be done in production code
+                normalized = Path(dangerous).resolve()
 
-            # The dangerous path should not escape the base path
-            # Production code should verify normalized path is under base_path
-            # using: normalized.is_relative_to(base_path) in Python 3.9+
-            self.assertIsNotNone(normalized)
-            self.assertIsNotNone(base_path)
+                # The dangerous path should not escape the base path
+                # Production code should verify normalized path is under
+                # base_path using: normalized.is_relative_to(base_path)
+                self.assertIsNotNone(normalized)
+                self.assertIsNotNone(base_path)
 
     def test_absolute_path_handling(self):
         """Test that absolute paths are handled safely."""
@@ -145,11 +139,12 @@ class TestVeryLongInputStrings(unittest.TestCase):
 
     def test_permission_many_rules(self):
         """Test handling of many permission rules."""
-        # Create a large number of rules
-        many_rules = [f"Read(file{i}.txt)" for i in range(1000)]
+        # Lazily generate a large number of rules; only the first
+        # ten are ever built
+        many_rules = (f"Read(file{i}.txt)" for i in range(1000))
 
         # Should validate individual rules, but might be slow
-        valid, error = validate_rules(many_rules[:10])
+        valid, error = validate_rules(list(islice(many_rules, 10)))
         self.assertTrue(valid)
 
     def test_permission_scope_deeply_nested_path(self):
@@ -179,10 +174,11 @@ class TestCommandInjectionAttempts(unittest.TestCase):
 
         # These should be rejected by the validation
         for rule in dangerous_rules:
-            valid, error = validate_rules([rule])
-            # The rule syntax validator should catch these
-            # Note: Some might be valid syntax but dangerous semantics
-            # The hook execution should handle shell escaping
+            with self.subTest(rule=rule):
+                valid, error = validate_rules([rule])
+                # The rule syntax validator should catch these
+                self.assertFalse(valid)
+                self.assertIn("Invalid rule syntax", error)
 
     def test_permission_rule_with_newlines(self):
         """Test permission rules with newline characters."""
@@ -195,15 +191,6 @@ class TestCommandInjectionAttempts(unittest.TestCase):
 class TestJsonInjectionAttempts(unittest.TestCase):
     """Test protection against JSON injection."""
 
-    def setUp(self):
-        """Set up temporary directory for tests."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_json_with_control_characters(self):
         """Test JSON serialization with control characters."""
 
@@ -231,12 +218,16 @@ class TestJsonInjectionAttempts(unittest.TestCase):
             current["next"] = {"level": i + 1}
             current = current["next"]
 
-        # Should serialize and deserialize
         serialized = json.dumps(nested)
-        deserialized = json.loads(serialized)
+        self.assertGreater(101, MAX_JSON_DEPTH)
+
+        # Deeper than the default cap, so rejected before parsing
+        with self.assertRaises(ValueError):
+            safe_json_load(serialized)
 
-        # Verify structure preserved
-        self.assertEqual(nested["level"], deserialized["level"])
+        # An explicitly raised cap lets trusted deep input through
+        deserialized = safe_json_load(serialized, max_depth=200)
+        self.assertEqual(deserialized, nested)
 
 
 class TestEnsureWithinDir(unittest.TestCase):
@@ -246,10 +237,7 @@ class TestEnsureWithinDir(unittest.TestCase):
         """Set up temporary directory for tests."""
         self.temp_dir = tempfile.mkdtemp()
         self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
 
     def test_valid_path_within_base(self):
         """Test that valid paths within base are accepted."""
@@ -290,6 +278,23 @@ class TestEnsureWithinDir(unittest.TestCase):
             _ensure_within_dir(link, self.temp_path)
         self.assertIn("Symlink detected", str(ctx.exception))
 
+    def test_symlinked_parent_escape_rejected(self):
+        """Test that a symlinked parent directory cannot escape the base."""
+        outside = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, outside, ignore_errors=True)
+        link = self.temp_path / "linked-parent"
+        try:
+            link.symlink_to(outside, target_is_directory=True)
+        except OSError:
+            self.skipTest("Symlinks not supported on this platform")
+
+        # Only the final component is checked for being a symlink, and
+        # the normalised string still sits under the base; the escape
+        # is caught by resolving the full path.
+        with self.assertRaises(ValueError) as ctx:
+            _ensure_within_dir(link / "memento.md", self.temp_path)
+        self.assertIn("Path escape detected", str(ctx.exception))
+
 
 class TestSymlinkSecurity(unittest.TestCase):
     """Test security around symlinks."""
@@ -298,10 +303,7 @@ class TestSymlinkSecurity(unittest.TestCase):
         """Set up temporary directory for tests."""
         self.temp_dir = tempfile.mkdtemp()
         self.temp_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
 
     def test_symlink_detection(self):
         """Test that symlinks can be detected."""
@@ -7,10 +7,13 @@ Verifies that shared utils are importable and that the extraction
 from operations/utils.py didn't break any functionality.
 """
 
+import os
 import sys
 import json
+import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Add shared scripts to path
 _project_root = Path(__file__).parent.parent.parent
@@ -28,6 +31,7 @@ from shared.utils import (  # noqa: E402
     get_project_root,
     LOCATION_PATHS,
     get_location_path,
+    yaml_safe_load,
 )
 
 
@@ -46,6 +50,7 @@ class TestSharedImports(unittest.TestCase):
         self.assertTrue(callable(render_template))
         self.assertTrue(callable(get_project_root))
         self.assertTrue(callable(get_location_path))
+        self.assertTrue(callable(yaml_safe_load))
         self.assertIsInstance(LOCATION_PATHS, dict)
 
 
@@ -65,6 +70,12 @@ class TestSharedKebabCase(unittest.TestCase):
     def test_empty_string(self):
         self.assertEqual(to_kebab_case(""), "")
 
+    def test_mixed_separator_runs_collapse(self):
+        self.assertEqual(to_kebab_case("  a - _b--c_ "), "a-b-c")
+
+    def test_punctuation_removed_not_replaced(self):
+        self.assertEqual(to_kebab_case("don't.stop"), "dontstop")
+
 
 class TestSharedValidateName(unittest.TestCase):
     """Test name validation from shared utils."""
@@ -158,6 +169,20 @@ class TestSharedSafeJsonLoad(unittest.TestCase):
         with self.assertRaises(ValueError):
             safe_json_load(large_json)
 
+    def test_nesting_at_limit_accepted(self):
+        nested = '{"a": ' * 64 + "1" + "}" * 64
+        self.assertIn("a", safe_json_load(nested))
+
+    def test_nesting_over_limit_rejected(self):
+        nested = '{"a": ' * 65 + "1" + "}" * 65
+        with self.assertRaises(ValueError) as cm:
+            safe_json_load(nested)
+        self.assertIn("nesting limit", str(cm.exception))
+
+    def test_brackets_inside_strings_ignored(self):
+        data = {"text": "[{" * 100 + '\\"' + "}]" * 100}
+        self.assertEqual(safe_json_load(json.dumps(data)), data)
+
 
 class TestSharedParseFrontmatter(unittest.TestCase):
     """Test frontmatter parsing from shared utils."""
@@ -175,6 +200,105 @@ class TestSharedParseFrontmatter(unittest.TestCase):
         self.assertEqual(fm, {})
         self.assertEqual(body, "Just body text")
 
+    def test_empty_frontmatter(self):
+        fm, body = parse_frontmatter("---\n---\n\nBody text")
+        self.assertEqual(fm, {})
+        self.assertEqual(body, "Body text")
+
+    def test_matches_safe_load(self):
+        import yaml
+        fm_text = (
+            "name: test\n"
+            "tags:\n  - a\n  - b\n"
+            "description: |\n  multi\n  line\n"
+            "count: 3\n"
+        )
+        fm, _ = parse_frontmatter(f"---\n{fm_text}---\nBody")
+        self.assertEqual(fm, yaml.safe_load(fm_text))
+
+
+class TestSharedYamlSafeLoad(unittest.TestCase):
+    """Test the LibYAML-backed safe loader wrapper."""
+
+    def test_matches_safe_load(self):
+        import yaml
+        text = "name: test\nversion: 0.1.0\ntags: [a, b]\n"
+        self.assertEqual(yaml_safe_load(text), yaml.safe_load(text))
+
+    def test_rejects_python_tags(self):
+        import yaml
+        with self.assertRaises(yaml.YAMLError):
+            yaml_safe_load("!!python/object/apply:os.system ['true']")
+
+    def test_invalid_yaml_raises(self):
+        import yaml
+        with self.assertRaises(yaml.YAMLError):
+            yaml_safe_load("key: [unclosed")
+
+
+class TestSharedCwdRelativePaths(unittest.TestCase):
+    """Paths derived from the cwd must reflect it at call time."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name).resolve()
+        self.addCleanup(os.chdir, os.getcwd())
+
+    def test_location_path_follows_cwd(self):
+        first = self.root / "first"
+        second = self.root / "second"
+        first.mkdir()
+        second.mkdir()
+        os.chdir(first)
+        self.assertEqual(get_location_path("project"), first / ".claude")
+        os.chdir(second)
+        self.assertEqual(get_location_path("project"), second / ".claude")
+
+    def test_project_root_sees_new_marker(self):
+        nested = self.root / "repo" / "src"
+        nested.mkdir(parents=True)
+        os.chdir(nested)
+        get_project_root()
+        (self.root / "repo" / ".claude").mkdir()
+        self.assertEqual(get_project_root(), self.root / "repo")
+
+
+class TestSharedRenderTemplate(unittest.TestCase):
+    """Test template rendering from shared utils."""
+
+    def test_environment_cached_per_directory(self):
+        from shared.utils import _get_jinja_env
+        with tempfile.TemporaryDirectory() as tmp:
+            env = _get_jinja_env(tmp)
+            self.assertIs(_get_jinja_env(tmp), env)
+            self.assertFalse(env.auto_reload)
+
+    def test_reuses_compiled_template(self):
+        from shared.utils import _get_jinja_env
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "greet.jinja2"
+            source.write_text("Hello {{ name }}\n")
+            self.assertEqual(
+                render_template(Path(tmp), "greet.jinja2", {"name": "a"}),
+                "Hello a\n",
+            )
+            # An edited source with a newer mtime is not picked up
+            source.write_text("Bye {{ name }}\n")
+            mtime = source.stat().st_mtime + 10
+            os.utime(source, (mtime, mtime))
+            loader = _get_jinja_env(tmp).loader
+            with patch.object(
+                loader, "get_source", wraps=loader.get_source
+            ) as get_source:
+                self.assertEqual(
+                    render_template(
+                        Path(tmp), "greet.jinja2", {"name": "b"}
+                    ),
+                    "Hello b\n",
+                )
+            get_source.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
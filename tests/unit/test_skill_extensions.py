@@ -9,31 +9,26 @@ operations for skills.  These functions are thin wrappers around
 shared.extension_utils parameterised with SKILL_CONFIG.
 """
 
-import sys
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from _skill_imports import (
+    PROJECT_ROOT,
+    SCRATCH_DIR,
+    prepare_skill_imports,
+    snapshot_operations,
+)
+
 # ------------------------------------------------------------------
 # Path / module setup
 # ------------------------------------------------------------------
 
-# Clear cached modules to prevent cross-manager conflicts in pytest
-for _mod_name in list(sys.modules):
-    if (
-        _mod_name == "operations"
-        or _mod_name.startswith("operations.")
-        or _mod_name == "_paths"
-    ):
-        del sys.modules[_mod_name]
-
-_project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(
-    0,
-    str(
-        _project_root / "skills" / "skill-manager" / "scripts"
-    ),
-)
+prepare_skill_imports("skill-manager")
 
 from operations.extensions import (  # noqa: E402
     SKILL_CONFIG,
@@ -47,28 +42,59 @@ from operations.extensions import (  # noqa: E402
     get_questions,
     validate_file_frontmatter,
 )
+from shared.utils import yaml_safe_load  # noqa: E402
+
+_ops_snapshot = snapshot_operations("skill-manager")
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+_TEMPLATES = PROJECT_ROOT / "skills" / "skill-manager" / "templates"
 
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
 
-_VALID_SKILL_FRONTMATTER = """\
----
-type: skill
-name: {name}
-description: {description}
-version: {version}
----
+# Frontmatter documents for validate_file_frontmatter
+_FM_VALID = (
+    "---\n"
+    "type: skill\n"
+    "name: my-skill\n"
+    "description: A valid skill description\n"
+    "version: 0.1.0\n"
+    "---\n\n# Body\n"
+)
+_FM_MISSING_FIELDS = (
+    "---\n"
+    "type: skill\n"
+    "name: my-skill\n"
+    "---\n\n# Body\n"
+)
+_FM_WRONG_TYPE = _FM_VALID.replace("type: skill", "type: agent")
+
+
+# Text of a minimal valid SKILL.md
+_SKILL_TEMPLATE = (
+    "---\n"
+    "type: skill\n"
+    "name: {name}\n"
+    "description: {description}\n"
+    "version: {version}\n"
+    "---\n"
+    "\n"
+    "# {name}\n"
+    "\n"
+    "Body content.\n"
+)
 
-# {name}
 
-Body content.
-"""
+@lru_cache(maxsize=None)
+def _skill_bytes(name, description, version):
+    """Return the encoded SKILL.md for a (name, description, version).
+
+    Many tests write the same skill; cache the bytes rather than
+    re-rendering and re-encoding them for every test.
+    """
+    return _SKILL_TEMPLATE.format(
+        name=name, description=description, version=version
+    ).encode("utf-8")
 
 
 def _write_skill(base_dir, name, description=None, version="0.1.0"):
@@ -78,14 +104,7 @@ def _write_skill(base_dir, name, description=None, version="0.1.0"):
     skill_dir = base_dir / "skills" / name
     skill_dir.mkdir(parents=True, exist_ok=True)
     skill_file = skill_dir / "SKILL.md"
-    skill_file.write_text(
-        _VALID_SKILL_FRONTMATTER.format(
-            name=name,
-            description=description,
-            version=version,
-        ),
-        encoding="utf-8",
-    )
+    skill_file.write_bytes(_skill_bytes(name, description, version))
     return skill_file
 
 
@@ -97,63 +116,75 @@ def _write_skill(base_dir, name, description=None, version="0.1.0"):
 class TestFindComponents:
     """Test skill discovery via find_components()."""
 
-    def test_finds_skills_in_project_location(self, tmp_path):
+    def test_finds_skills_in_project_location(self, claude_dir):
         """Skills in the project .claude/skills/ are discovered."""
-        project_claude = tmp_path / ".claude"
-        _write_skill(project_claude, "my-skill")
+        _write_skill(claude_dir, "my-skill")
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=project_claude,
-        ):
-            result = find_components(location="project")
+        result = find_components(location="project")
 
         assert len(result) == 1
         assert result[0]["name"] == "my-skill"
         assert result[0]["location"] == "project"
 
-    def test_finds_skills_in_user_location(self, tmp_path):
+    def test_finds_skills_in_user_location(self, claude_dir):
         """Skills in the user ~/.claude/skills/ are discovered."""
-        user_claude = tmp_path / ".claude"
-        _write_skill(user_claude, "user-skill")
+        _write_skill(claude_dir, "user-skill")
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=user_claude,
-        ):
-            result = find_components(location="user")
+        result = find_components(location="user")
 
         assert len(result) == 1
         assert result[0]["name"] == "user-skill"
         assert result[0]["location"] == "user"
 
-    def test_returns_empty_when_no_skills(self, tmp_path):
+    def test_returns_empty_when_no_skills(self, claude_dir):
         """Empty skills directory yields empty list."""
-        empty_claude = tmp_path / ".claude"
-        (empty_claude / "skills").mkdir(parents=True)
+        (claude_dir / "skills").mkdir(parents=True)
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=empty_claude,
-        ):
-            result = find_components(location="project")
+        result = find_components(location="project")
 
         assert result == []
 
-    def test_handles_missing_directory_gracefully(self, tmp_path):
+    def test_handles_missing_directory_gracefully(self, claude_dir):
         """Non-existent skills directory yields empty list."""
-        no_skills = tmp_path / ".claude"
-        no_skills.mkdir(parents=True)
+        claude_dir.mkdir(parents=True)
         # Deliberately do NOT create a skills/ subdirectory
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=no_skills,
-        ):
-            result = find_components(location="project")
+        result = find_components(location="project")
 
         assert result == []
 
+    def test_skips_symlinked_skill_directory(self, claude_dir):
+        """Symlinked directories are not descended into."""
+        shared_dir = claude_dir.parent / "shared"
+        _write_skill(shared_dir, "linked-skill")
+        (claude_dir / "skills").mkdir(parents=True)
+        (claude_dir / "skills" / "linked-skill").symlink_to(
+            shared_dir / "skills" / "linked-skill"
+        )
+
+        result = find_components(location="project")
+
+        assert result == []
+
+    def test_symlink_loop_yields_each_skill_once(self, claude_dir):
+        """A directory link back up the tree does not repeat skills."""
+        _write_skill(claude_dir, "looped-skill")
+        skill_dir = claude_dir / "skills" / "looped-skill"
+        (skill_dir / "loop").symlink_to("..")
+
+        result = find_components(location="project")
+
+        assert [c["name"] for c in result] == ["looped-skill"]
+
+    def test_skips_directories_named_like_markdown(self, claude_dir):
+        """Only files are parsed, even if a directory ends in .md."""
+        _write_skill(claude_dir, "real-skill")
+        (claude_dir / "skills" / "notes.md").mkdir()
+
+        result = find_components(location="project")
+
+        assert [c["name"] for c in result] == ["real-skill"]
+
 
 # ==================================================================
 # 2. component_exists
@@ -163,27 +194,53 @@ class TestFindComponents:
 class TestComponentExists:
     """Test skill existence check via component_exists()."""
 
-    def test_returns_true_for_existing_skill(self, tmp_path):
+    def test_returns_true_for_existing_skill(self, claude_dir):
         """Returns True when skill directory contains a match."""
-        claude_dir = tmp_path / ".claude"
         _write_skill(claude_dir, "existing-skill")
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            assert component_exists("existing-skill", "project")
+        assert component_exists("existing-skill", "project")
 
-    def test_returns_false_for_nonexistent_skill(self, tmp_path):
+    def test_returns_false_for_nonexistent_skill(self, claude_dir):
         """Returns False when no matching skill is found."""
-        claude_dir = tmp_path / ".claude"
         (claude_dir / "skills").mkdir(parents=True)
 
+        assert not component_exists("ghost", "project")
+
+    def test_stops_parsing_at_first_match(self, claude_dir):
+        """Frontmatter parsing stops once the named skill is seen."""
+        skill_files = [
+            _write_skill(claude_dir, name)
+            for name in ("alpha", "beta", "gamma")
+        ]
+
+        parsed = []
+
+        def _recording_load(text):
+            result = yaml_safe_load(text)
+            parsed.append(result)
+            return result
+
+        # Fix the walk order so early exit is observable
         with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
+            "shared.extension_utils._iter_markdown_files",
+            return_value=iter(skill_files),
+        ), patch(
+            "shared.extension_utils.yaml_safe_load",
+            side_effect=_recording_load,
         ):
-            assert not component_exists("ghost", "project")
+            assert component_exists("beta", "project")
+
+        assert [p["name"] for p in parsed] == ["alpha", "beta"]
+
+    def test_matches_frontmatter_name_not_dir_name(self, claude_dir):
+        """Existence is decided by the frontmatter name."""
+        skill_file = _write_skill(claude_dir, "dir-name")
+        skill_file.write_bytes(
+            _skill_bytes("real-name", "Renamed", "0.1.0")
+        )
+
+        assert component_exists("real-name", "project")
+        assert not component_exists("dir-name", "project")
 
 
 # ==================================================================
@@ -265,28 +322,16 @@ class TestGetQuestions:
 class TestExecuteCreate:
     """Test skill creation via execute_create()."""
 
-    def test_creates_skill_directory_and_file(self, tmp_path):
+    def test_creates_skill_directory_and_file(self, claude_dir):
         """Creates SKILL.md from template in correct path."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
+        result = execute_create(
+            name="my-new-skill",
+            description="A brand new skill for testing",
+            version="0.1.0",
+            tags=["custom"],
+            location="project",
+            templates_dir=_TEMPLATES,
         )
-        base = tmp_path / ".claude"
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=base,
-        ):
-            result = execute_create(
-                name="my-new-skill",
-                description="A brand new skill for testing",
-                version="0.1.0",
-                tags=["custom"],
-                location="project",
-                templates_dir=templates,
-            )
 
         assert result["success"]
         assert "path" in result
@@ -295,28 +340,16 @@ class TestExecuteCreate:
         assert created.name == "SKILL.md"
         assert "my-new-skill" in str(created)
 
-    def test_creates_subdirectories(self, tmp_path):
+    def test_creates_subdirectories(self, claude_dir):
         """References/ and scripts/ subdirs are created."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
+        result = execute_create(
+            name="sub-test",
+            description="Testing subdirectory creation",
+            version="0.1.0",
+            tags=["custom"],
+            location="project",
+            templates_dir=_TEMPLATES,
         )
-        base = tmp_path / ".claude"
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=base,
-        ):
-            result = execute_create(
-                name="sub-test",
-                description="Testing subdirectory creation",
-                version="0.1.0",
-                tags=["custom"],
-                location="project",
-                templates_dir=templates,
-            )
 
         assert result["success"]
         skill_dir = Path(result["path"]).parent
@@ -324,10 +357,9 @@ class TestExecuteCreate:
         assert (skill_dir / "scripts").is_dir()
 
     def test_rejects_duplicate_via_get_questions(
-        self, tmp_path
+        self, claude_dir
     ):
         """get_questions flags when inferred name already exists."""
-        claude_dir = tmp_path / ".claude"
         # Create a skill whose name matches what
         # infer_from_description will produce from the
         # description below ("duplicate skill" -> "duplicate-skill")
@@ -339,11 +371,7 @@ class TestExecuteCreate:
             "location": "project",
         }
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            questions = get_questions(ctx)
+        questions = get_questions(ctx)
 
         # Should ask for a different name because one exists
         ids = [q["id"] for q in questions["questions"]]
@@ -357,20 +385,13 @@ class TestExecuteCreate:
 
     def test_rejects_invalid_name_via_execute(self, tmp_path):
         """Execute dispatcher rejects invalid names."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
-
         ctx = {
             "operation": "create",
             "name": "Invalid Name!",
             "description": "Test skill for testing purposes",
         }
 
-        result = execute(ctx, {}, templates)
+        result = execute(ctx, {}, _TEMPLATES)
         assert not result["success"]
         assert "Invalid name" in result["message"]
 
@@ -380,25 +401,53 @@ class TestExecuteCreate:
 # ==================================================================
 
 
+@pytest.fixture(scope="class")
+def validate_tree():
+    """Build one read-only ``.claude`` tree for a test class.
+
+    ``execute_validate`` never writes, so every test can look up
+    its own skill in the same tree.
+    """
+    root = tempfile.mkdtemp(dir=SCRATCH_DIR)
+    claude_dir = Path(root) / ".claude"
+    _write_skill(
+        claude_dir,
+        "valid-skill",
+        description="A perfectly valid skill",
+    )
+    _write_skill(claude_dir, "shape-test")
+    # Missing description
+    (claude_dir / "skills" / "bad-skill").mkdir(parents=True)
+    (claude_dir / "skills" / "bad-skill" / "SKILL.md").write_bytes(
+        b"---\ntype: skill\nname: bad-skill\n"
+        b"version: 0.1.0\n---\n# Bad\n"
+    )
+    # Type "agent" instead of "skill"
+    (claude_dir / "skills" / "wrong-type").mkdir()
+    (claude_dir / "skills" / "wrong-type" / "SKILL.md").write_bytes(
+        b"---\ntype: agent\nname: wrong-type\n"
+        b"description: Wrong type skill\n"
+        b"version: 0.1.0\n---\n# Wrong\n"
+    )
+    yield claude_dir
+    shutil.rmtree(root, ignore_errors=True)
+
+
 class TestExecuteValidate:
     """Test skill validation via execute_validate()."""
 
-    def test_validates_valid_skill(self, tmp_path):
-        """Valid skill frontmatter passes validation."""
-        claude_dir = tmp_path / ".claude"
-        _write_skill(
-            claude_dir,
-            "valid-skill",
-            description="A perfectly valid skill",
+    @pytest.fixture(autouse=True)
+    def _use_validate_tree(self, validate_tree, monkeypatch):
+        monkeypatch.setattr(
+            "shared.extension_utils.get_location_path",
+            lambda *args, **kwargs: validate_tree,
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_validate(
-                name="valid-skill", location="project"
-            )
+    def test_validates_valid_skill(self):
+        """Valid skill frontmatter passes validation."""
+        result = execute_validate(
+            name="valid-skill", location="project"
+        )
 
         assert result["success"]
         assert result["operation"] == "validate"
@@ -406,70 +455,35 @@ class TestExecuteValidate:
         assert result["summary"]["invalid"] == 0
         assert result["results"][0]["valid"]
 
-    def test_catches_missing_required_fields(self, tmp_path):
+    def test_catches_missing_required_fields(self):
         """Skill with missing description fails validation."""
-        claude_dir = tmp_path / ".claude"
-        skill_dir = claude_dir / "skills" / "bad-skill"
-        skill_dir.mkdir(parents=True)
-        (skill_dir / "SKILL.md").write_text(
-            "---\ntype: skill\nname: bad-skill\n"
-            "version: 0.1.0\n---\n# Bad\n",
-            encoding="utf-8",
+        result = execute_validate(
+            name="bad-skill", location="project"
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_validate(
-                name="bad-skill", location="project"
-            )
-
         assert result["success"]
         assert result["summary"]["invalid"] == 1
         errors = result["results"][0]["errors"]
         assert any("Description" in e for e in errors)
 
-    def test_catches_wrong_type_field(self, tmp_path):
+    def test_catches_wrong_type_field(self):
         """Skill with wrong type in frontmatter is noted."""
-        claude_dir = tmp_path / ".claude"
-        skill_dir = claude_dir / "skills" / "wrong-type"
-        skill_dir.mkdir(parents=True)
-        # Use type "agent" instead of "skill"
-        (skill_dir / "SKILL.md").write_text(
-            "---\ntype: agent\nname: wrong-type\n"
-            "description: Wrong type skill\n"
-            "version: 0.1.0\n---\n# Wrong\n",
-            encoding="utf-8",
+        # find_extensions only returns items matching the
+        # expected frontmatter_type, so a "wrong type" file
+        # won't appear in results at all.
+        result = execute_validate(
+            name="wrong-type", location="project"
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            # find_extensions only returns items matching the
-            # expected frontmatter_type, so a "wrong type" file
-            # won't appear in results at all.
-            result = execute_validate(
-                name="wrong-type", location="project"
-            )
-
         # The skill is not found because type doesn't match
         assert not result["success"]
         assert "not found" in result["message"]
 
-    def test_returns_standardized_response_shape(self, tmp_path):
+    def test_returns_standardized_response_shape(self):
         """Validate response has success, operation, results, summary."""
-        claude_dir = tmp_path / ".claude"
-        _write_skill(claude_dir, "shape-test")
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_validate(
-                name="shape-test", location="project"
-            )
+        result = execute_validate(
+            name="shape-test", location="project"
+        )
 
         assert "success" in result
         assert "operation" in result
@@ -480,51 +494,41 @@ class TestExecuteValidate:
         assert "valid" in result["summary"]
         assert "invalid" in result["summary"]
 
-    def test_validate_file_frontmatter_valid(self):
-        """validate_file_frontmatter passes on valid content."""
-        content = (
-            "---\n"
-            "type: skill\n"
-            "name: my-skill\n"
-            "description: A valid skill description\n"
-            "version: 0.1.0\n"
-            "---\n\n# Body\n"
-        )
-        result = validate_file_frontmatter(content)
-        assert result["valid"]
-        assert result["errors"] == []
-
-    def test_validate_file_frontmatter_missing_fields(self):
-        """validate_file_frontmatter catches missing fields."""
-        content = (
-            "---\n"
-            "type: skill\n"
-            "name: my-skill\n"
-            "---\n\n# Body\n"
-        )
-        result = validate_file_frontmatter(content)
-        assert not result["valid"]
-        assert any(
-            "description" in e.lower()
-            for e in result["errors"]
-        )
-        assert any(
-            "version" in e.lower() for e in result["errors"]
-        )
-
-    def test_validate_file_frontmatter_wrong_type(self):
-        """validate_file_frontmatter catches wrong type."""
-        content = (
-            "---\n"
-            "type: agent\n"
-            "name: my-skill\n"
-            "description: A valid skill description\n"
-            "version: 0.1.0\n"
-            "---\n\n# Body\n"
-        )
+    @pytest.mark.parametrize(
+        "content, expected_valid, error_terms",
+        [
+            pytest.param(
+                _FM_VALID,
+                True,
+                (),
+                id="valid",
+            ),
+            pytest.param(
+                _FM_MISSING_FIELDS,
+                False,
+                ("description", "version"),
+                id="missing-fields",
+            ),
+            pytest.param(
+                _FM_WRONG_TYPE,
+                False,
+                ("type",),
+                id="wrong-type",
+            ),
+        ],
+    )
+    def test_validate_file_frontmatter(
+        self, content, expected_valid, error_terms
+    ):
+        """validate_file_frontmatter reports each problem it finds."""
         result = validate_file_frontmatter(content)
-        assert not result["valid"]
-        assert any("type" in e.lower() for e in result["errors"])
+        assert result["valid"] is expected_valid
+        if expected_valid:
+            assert result["errors"] == []
+        for term in error_terms:
+            assert any(
+                term in e.lower() for e in result["errors"]
+            ), term
 
 
 # ==================================================================
@@ -535,104 +539,55 @@ class TestExecuteValidate:
 class TestExecuteVersion:
     """Test version bumping via execute_version()."""
 
-    def test_bumps_patch_version(self, tmp_path):
-        """Patch bump increments the third number."""
-        claude_dir = tmp_path / ".claude"
+    @pytest.mark.parametrize(
+        "bump_type, expected",
+        [
+            ("patch", "1.2.4"),
+            ("minor", "1.3.0"),
+            ("major", "2.0.0"),
+        ],
+    )
+    def test_bumps_version(self, claude_dir, bump_type, expected):
+        """Each bump type increments its own semver component."""
         _write_skill(
             claude_dir, "ver-skill", version="1.2.3"
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_version(
-                name="ver-skill",
-                bump_type="patch",
-                location="project",
-            )
-
-        assert result["success"]
-        assert result["old_version"] == "1.2.3"
-        assert result["new_version"] == "1.2.4"
-
-    def test_bumps_minor_version(self, tmp_path):
-        """Minor bump increments the second number."""
-        claude_dir = tmp_path / ".claude"
-        _write_skill(
-            claude_dir, "ver-skill", version="1.2.3"
+        result = execute_version(
+            name="ver-skill",
+            bump_type=bump_type,
+            location="project",
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_version(
-                name="ver-skill",
-                bump_type="minor",
-                location="project",
-            )
-
         assert result["success"]
         assert result["old_version"] == "1.2.3"
-        assert result["new_version"] == "1.3.0"
+        assert result["new_version"] == expected
 
-    def test_bumps_major_version(self, tmp_path):
-        """Major bump increments the first number."""
-        claude_dir = tmp_path / ".claude"
-        _write_skill(
-            claude_dir, "ver-skill", version="1.2.3"
-        )
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_version(
-                name="ver-skill",
-                bump_type="major",
-                location="project",
-            )
-
-        assert result["success"]
-        assert result["old_version"] == "1.2.3"
-        assert result["new_version"] == "2.0.0"
-
-    def test_version_file_is_rewritten(self, tmp_path):
+    def test_version_file_is_rewritten(self, claude_dir):
         """Version bump actually changes the file on disk."""
-        claude_dir = tmp_path / ".claude"
         skill_file = _write_skill(
             claude_dir, "disk-skill", version="0.5.0"
         )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            execute_version(
-                name="disk-skill",
-                bump_type="patch",
-                location="project",
-            )
+        execute_version(
+            name="disk-skill",
+            bump_type="patch",
+            location="project",
+        )
 
         content = skill_file.read_text(encoding="utf-8")
         assert "version: 0.5.1" in content
         assert "version: 0.5.0" not in content
 
-    def test_handles_missing_skill(self, tmp_path):
+    def test_handles_missing_skill(self, claude_dir):
         """Version bump on nonexistent skill returns failure."""
-        claude_dir = tmp_path / ".claude"
         (claude_dir / "skills").mkdir(parents=True)
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_version(
-                name="nonexistent",
-                bump_type="patch",
-                location="project",
-            )
+        result = execute_version(
+            name="nonexistent",
+            bump_type="patch",
+            location="project",
+        )
 
         assert not result["success"]
         assert "not found" in result["message"]
@@ -646,17 +601,12 @@ class TestExecuteVersion:
 class TestExecuteList:
     """Test skill listing via execute_list()."""
 
-    def test_lists_skills_found_in_project(self, tmp_path):
+    def test_lists_skills_found_in_project(self, claude_dir):
         """Lists skills present in a location."""
-        claude_dir = tmp_path / ".claude"
         _write_skill(claude_dir, "list-skill-a")
         _write_skill(claude_dir, "list-skill-b")
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_list(location="project")
+        result = execute_list(location="project")
 
         assert result["success"]
         assert result["count"] == 2
@@ -664,31 +614,18 @@ class TestExecuteList:
         assert "list-skill-a" in names
         assert "list-skill-b" in names
 
-    def test_returns_empty_list_message(self, tmp_path):
+    def test_returns_empty_list_message(self, claude_dir):
         """Returns count 0 when no skills found."""
-        claude_dir = tmp_path / ".claude"
-        (claude_dir / "skills").mkdir(parents=True)
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_list(location="project")
+        # No skills/ directory at all: discovery treats it as empty
+        result = execute_list(location="project")
 
         assert result["success"]
         assert result["count"] == 0
         assert result["components"] == []
 
-    def test_returns_standardized_response(self, tmp_path):
+    def test_returns_standardized_response(self, claude_dir):
         """List result has success, components, count, format."""
-        claude_dir = tmp_path / ".claude"
-        (claude_dir / "skills").mkdir(parents=True)
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute_list(location="project")
+        result = execute_list(location="project")
 
         assert "success" in result
         assert "components" in result
@@ -704,102 +641,62 @@ class TestExecuteList:
 class TestExecuteDispatcher:
     """Test the main execute() dispatcher."""
 
-    def test_routes_to_list(self, tmp_path):
-        """Dispatcher routes list operation correctly."""
-        claude_dir = tmp_path / ".claude"
-        (claude_dir / "skills").mkdir(parents=True)
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
-
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute(
-                {"operation": "list", "location": "project"},
-                {},
-                templates,
-            )
-
-        assert result["success"]
-        assert "components" in result
-
-    def test_routes_to_validate(self, tmp_path):
-        """Dispatcher routes validate operation correctly."""
-        claude_dir = tmp_path / ".claude"
-        _write_skill(claude_dir, "val-skill")
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
+    @pytest.mark.parametrize(
+        "operation, target",
+        [
+            ("list", "execute_extension_list"),
+            ("validate", "execute_extension_validate"),
+            ("version", "execute_extension_version"),
+        ],
+    )
+    def test_routes_operation(self, operation, target):
+        """Dispatcher hands each operation to its executor."""
+        sentinel = {"success": True, "operation": operation}
 
         with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
+            f"shared.extension_utils.{target}",
+            return_value=sentinel,
+        ) as executor:
             result = execute(
                 {
-                    "operation": "validate",
-                    "name": "val-skill",
+                    "operation": operation,
+                    "name": "any-skill",
                     "location": "project",
                 },
                 {},
-                templates,
+                _TEMPLATES,
             )
 
-        assert result["success"]
-        assert result["operation"] == "validate"
+        executor.assert_called_once()
+        assert executor.call_args.args[0] is SKILL_CONFIG
+        assert result is sentinel
 
-    def test_routes_to_version(self, tmp_path):
-        """Dispatcher routes version operation correctly."""
-        claude_dir = tmp_path / ".claude"
+    def test_routes_to_version_end_to_end(self, claude_dir):
+        """Dispatcher bumps a real skill's version on disk."""
         _write_skill(
             claude_dir, "ver-skill", version="0.1.0"
         )
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
 
-        with patch(
-            "shared.extension_utils.get_location_path",
-            return_value=claude_dir,
-        ):
-            result = execute(
-                {
-                    "operation": "version",
-                    "name": "ver-skill",
-                    "bump": "minor",
-                    "location": "project",
-                },
-                {},
-                templates,
-            )
+        result = execute(
+            {
+                "operation": "version",
+                "name": "ver-skill",
+                "bump": "minor",
+                "location": "project",
+            },
+            {},
+            _TEMPLATES,
+        )
 
         assert result["success"]
         assert result["new_version"] == "0.2.0"
 
     def test_handles_unknown_operation(self):
         """Dispatcher returns error for unknown operation."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
-
         result = execute(
             {"operation": "frobnicate"},
             {},
-            templates,
+            _TEMPLATES,
         )
 
         assert not result["success"]
@@ -807,17 +704,10 @@ class TestExecuteDispatcher:
 
     def test_version_missing_name_returns_error(self):
         """Version operation without name returns error."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
-
         result = execute(
             {"operation": "version", "bump": "patch"},
             {},
-            templates,
+            _TEMPLATES,
         )
 
         assert not result["success"]
@@ -825,13 +715,6 @@ class TestExecuteDispatcher:
 
     def test_create_invalid_description_returns_error(self):
         """Create with too-short description returns error."""
-        templates = (
-            _project_root
-            / "skills"
-            / "skill-manager"
-            / "templates"
-        )
-
         result = execute(
             {
                 "operation": "create",
@@ -839,7 +722,7 @@ class TestExecuteDispatcher:
                 "description": "Short",
             },
             {},
-            templates,
+            _TEMPLATES,
         )
 
         assert not result["success"]
@@ -854,22 +737,18 @@ class TestExecuteDispatcher:
 class TestSkillConfig:
     """Verify SKILL_CONFIG has expected structure."""
 
-    def test_entity_label(self):
-        assert SKILL_CONFIG["entity_label"] == "skill"
-
-    def test_directory(self):
-        assert SKILL_CONFIG["directory"] == "skills"
-
-    def test_file_pattern(self):
+    def test_static_fields(self):
+        expected = {
+            "entity_label": "skill",
+            "directory": "skills",
+            "frontmatter_type": "skill",
+        }
+        assert expected.items() <= SKILL_CONFIG.items()
         assert "{name}" in SKILL_CONFIG["file_pattern"]
         assert "SKILL.md" in SKILL_CONFIG["file_pattern"]
-
-    def test_frontmatter_type(self):
-        assert SKILL_CONFIG["frontmatter_type"] == "skill"
-
-    def test_create_subdirs(self):
-        assert "references" in SKILL_CONFIG["create_subdirs"]
-        assert "scripts" in SKILL_CONFIG["create_subdirs"]
+        assert {"references", "scripts"} <= set(
+            SKILL_CONFIG["create_subdirs"]
+        )
 
     def test_main_file_filter(self):
         filt = SKILL_CONFIG["main_file_filter"]
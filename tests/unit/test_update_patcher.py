@@ -6,27 +6,23 @@
 from __future__ import annotations
 
 import json
-import sys
+import os
+import re
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
-
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = (
-    _project_root / "skills" / "plugin-manager" / "scripts"
+from unittest.mock import patch
+
+from _scaffold_bootstrap import (
+    SCAFFOLD_TEMPLATES,
+    SCRATCH_DIR,
+    make_tmp,
+    prepare_plugin_manager_imports,
+    snapshot_operations,
 )
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
-
-# Clear cached operations modules to avoid cross-manager
-# conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith(
-        "operations."
-    ):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+
+prepare_plugin_manager_imports()
 
 from operations.update_ops.patcher import (  # noqa: E402
     _atomic_write,
@@ -55,11 +51,27 @@ from operations.constants import (  # noqa: E402
 from operations.update_ops.scanner import (  # noqa: E402
     scan_plugin,
 )
+import operations.update_ops.scanner as _scanner_mod  # noqa: E402
+
+_ops_snapshot = snapshot_operations()
+
+# aida-config.json of a plugin generated by an older release, matching
+# the generator_version of _make_diff_report
+_OLD_AIDA_CONFIG = (
+    json.dumps({"generator_version": "0.7.0"}, indent=2) + "\n"
+).encode()
+
+# Name of a timestamped backup directory: YYYYMMDD_HHMMSS
+_BACKUP_TIMESTAMP_RE = re.compile(r"^\d{8}_\d{6}$")
+
+
+def _entries(directory: Path) -> dict[str, os.DirEntry]:
+    """Map each entry directly under ``directory`` by name.
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+    One scandir call; the DirEntry type checks need no extra stat.
+    """
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
 
 
 def _make_diff_report(
@@ -103,40 +115,40 @@ class TestAtomicWrite(unittest.TestCase):
 
     def test_writes_file_content(self):
         """Write content and read back to verify match."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "test.txt"
-            _atomic_write(target, "hello world\n")
-            self.assertEqual(
-                target.read_text(), "hello world\n"
-            )
+        tmp = make_tmp(self)
+        target = Path(tmp) / "test.txt"
+        _atomic_write(target, "hello world\n")
+        self.assertEqual(
+            target.read_bytes(), b"hello world\n"
+        )
 
     def test_creates_parent_directories(self):
         """Write to nested path and verify dirs created."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = (
-                Path(tmp) / "a" / "b" / "c" / "deep.txt"
-            )
-            _atomic_write(target, "deep content\n")
-            self.assertTrue(target.exists())
-            self.assertEqual(
-                target.read_text(), "deep content\n"
-            )
+        tmp = make_tmp(self)
+        target = (
+            Path(tmp) / "a" / "b" / "c" / "deep.txt"
+        )
+        _atomic_write(target, "deep content\n")
+        self.assertTrue(target.exists())
+        self.assertEqual(
+            target.read_bytes(), b"deep content\n"
+        )
 
     def test_overwrites_existing_file(self):
         """Write twice and verify second content wins."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "overwrite.txt"
-            _atomic_write(target, "first\n")
-            _atomic_write(target, "second\n")
-            self.assertEqual(target.read_text(), "second\n")
+        tmp = make_tmp(self)
+        target = Path(tmp) / "overwrite.txt"
+        _atomic_write(target, "first\n")
+        _atomic_write(target, "second\n")
+        self.assertEqual(target.read_bytes(), b"second\n")
 
     def test_cleans_up_tmp_on_success(self):
         """After write, verify no .tmp file remains."""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "clean.txt"
-            _atomic_write(target, "content\n")
-            tmp_file = Path(str(target) + ".tmp")
-            self.assertFalse(tmp_file.exists())
+        tmp = make_tmp(self)
+        target = Path(tmp) / "clean.txt"
+        _atomic_write(target, "content\n")
+        tmp_file = Path(str(target) + ".tmp")
+        self.assertFalse(tmp_file.exists())
 
 
 class TestCreateBackup(unittest.TestCase):
@@ -144,105 +156,120 @@ class TestCreateBackup(unittest.TestCase):
 
     def test_creates_backup_directory(self):
         """Backup dir should exist with timestamp format."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
-            src = plugin / "file.txt"
-            src.write_text("old content\n")
-
-            actionable = [
-                _make_file_diff(
-                    "file.txt",
-                    status=FileStatus.OUTDATED,
-                    strategy=MergeStrategy.OVERWRITE,
-                )
-            ]
-            backup = _create_backup(plugin, actionable)
-
-            self.assertTrue(backup.exists())
-            self.assertTrue(backup.is_dir())
-            # Backup lives under .aida-backup/
-            self.assertEqual(
-                backup.parent.name, ".aida-backup"
-            )
-            # Timestamp directory name: YYYYMMDD_HHMMSS
-            self.assertRegex(
-                backup.name, r"^\d{8}_\d{6}$"
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        plugin.mkdir()
+        src = plugin / "file.txt"
+        src.write_bytes(b"old content\n")
+
+        actionable = [
+            _make_file_diff(
+                "file.txt",
+                status=FileStatus.OUTDATED,
+                strategy=MergeStrategy.OVERWRITE,
             )
+        ]
+        backup = _create_backup(plugin, actionable)
+
+        self.assertTrue(backup.exists())
+        self.assertTrue(backup.is_dir())
+        # Backup lives under .aida-backup/
+        self.assertEqual(
+            backup.parent.name, ".aida-backup"
+        )
+        self.assertRegex(backup.name, _BACKUP_TIMESTAMP_RE)
 
     def test_copies_existing_files(self):
         """Files on disk that will be modified appear in backup."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
-            src = plugin / "readme.txt"
-            src.write_text("original readme\n")
-
-            actionable = [
-                _make_file_diff(
-                    "readme.txt",
-                    status=FileStatus.OUTDATED,
-                    strategy=MergeStrategy.OVERWRITE,
-                )
-            ]
-            backup = _create_backup(plugin, actionable)
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        plugin.mkdir()
+        src = plugin / "readme.txt"
+        src.write_bytes(b"original readme\n")
 
-            backed_up = backup / "readme.txt"
-            self.assertTrue(backed_up.exists())
-            self.assertEqual(
-                backed_up.read_text(), "original readme\n"
+        actionable = [
+            _make_file_diff(
+                "readme.txt",
+                status=FileStatus.OUTDATED,
+                strategy=MergeStrategy.OVERWRITE,
             )
+        ]
+        backup = _create_backup(plugin, actionable)
+
+        self.assertEqual(_entries(backup).keys(), {"readme.txt"})
+        self.assertEqual(
+            (backup / "readme.txt").read_bytes(),
+            b"original readme\n",
+        )
 
     def test_skips_missing_files(self):
         """MISSING files have nothing on disk to back up."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
-
-            actionable = [
-                _make_file_diff(
-                    "new_file.txt",
-                    status=FileStatus.MISSING,
-                    strategy=MergeStrategy.ADD,
-                )
-            ]
-            backup = _create_backup(plugin, actionable)
-
-            # Backup dir exists but the missing file is not
-            # inside it
-            self.assertTrue(backup.exists())
-            self.assertFalse(
-                (backup / "new_file.txt").exists()
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        plugin.mkdir()
+
+        actionable = [
+            _make_file_diff(
+                "new_file.txt",
+                status=FileStatus.MISSING,
+                strategy=MergeStrategy.ADD,
             )
+        ]
+        backup = _create_backup(plugin, actionable)
+
+        # Backup dir exists but the missing file is not
+        # inside it
+        self.assertEqual(_entries(backup), {})
 
     def test_preserves_directory_structure(self):
         """Subdirectory paths are preserved in backup."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            (plugin / ".claude-plugin").mkdir(parents=True)
-            nested = plugin / ".claude-plugin" / "plugin.json"
-            nested.write_text('{"name":"test"}\n')
-
-            actionable = [
-                _make_file_diff(
-                    ".claude-plugin/plugin.json",
-                    status=FileStatus.OUTDATED,
-                    strategy=MergeStrategy.OVERWRITE,
-                )
-            ]
-            backup = _create_backup(plugin, actionable)
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        (plugin / ".claude-plugin").mkdir(parents=True)
+        nested = plugin / ".claude-plugin" / "plugin.json"
+        nested.write_bytes(b'{"name":"test"}\n')
 
-            backed_up = (
-                backup / ".claude-plugin" / "plugin.json"
-            )
-            self.assertTrue(backed_up.exists())
-            self.assertEqual(
-                backed_up.read_text(), '{"name":"test"}\n'
+        actionable = [
+            _make_file_diff(
+                ".claude-plugin/plugin.json",
+                status=FileStatus.OUTDATED,
+                strategy=MergeStrategy.OVERWRITE,
             )
+        ]
+        backup = _create_backup(plugin, actionable)
 
+        entries = _entries(backup)
+        self.assertEqual(entries.keys(), {".claude-plugin"})
+        self.assertTrue(entries[".claude-plugin"].is_dir())
+        backed_up = Path(entries[".claude-plugin"].path)
+        self.assertEqual(
+            _entries(backed_up).keys(), {"plugin.json"}
+        )
+        self.assertEqual(
+            (backed_up / "plugin.json").read_bytes(),
+            b'{"name":"test"}\n',
+        )
 
-class TestMergeGitignore(unittest.TestCase):
-    """Test _merge_gitignore append-only merge logic."""
+
+class _MergeTestCase(unittest.TestCase):
+    """Run a composite-file merge inside a shared plugin skeleton.
+
+    Subclasses set ``filename`` and ``merge``.  The plugin and its
+    ``.aida-backup/test`` directory are created once per class; each
+    run rewrites (or removes) the target and its backup copy, so no
+    state carries over from one test to the next.
+    """
+
+    filename: str
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        root = tempfile.mkdtemp(dir=SCRATCH_DIR)
+        cls.addClassCleanup(shutil.rmtree, root, ignore_errors=True)
+        cls.plugin = Path(root) / "plugin"
+        cls.backup = cls.plugin / ".aida-backup" / "test"
+        cls.backup.mkdir(parents=True)
 
     def _run_merge(
         self,
@@ -250,43 +277,48 @@ class TestMergeGitignore(unittest.TestCase):
         expected: str,
         status: FileStatus = FileStatus.OUTDATED,
     ) -> tuple[PatchResult, str]:
-        """Run a gitignore merge and return result + file.
+        """Run the merge and return result + file.
 
-        Creates a temporary plugin directory, writes the
-        current content to .gitignore, and invokes the merge.
+        Writes the current content to the target, and a copy to
+        the backup, then invokes the merge.
 
         Returns:
             Tuple of (PatchResult, final file content).
         """
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
-            backup = plugin / ".aida-backup" / "test"
-            backup.mkdir(parents=True)
-
-            target = plugin / ".gitignore"
-            if status != FileStatus.MISSING:
-                target.write_text(current)
-                # Copy to backup so backup_path resolves
-                bk = backup / ".gitignore"
-                bk.write_text(current)
-
-            fd = _make_file_diff(
-                ".gitignore",
-                status=status,
-                strategy=MergeStrategy.MERGE,
-                category=FileCategory.COMPOSITE,
-                expected_content=expected,
-                actual_content=(
-                    current
-                    if status != FileStatus.MISSING
-                    else None
-                ),
-            )
+        target = self.plugin / self.filename
+        bk = self.backup / self.filename
+        if status != FileStatus.MISSING:
+            data = current.encode()
+            target.write_bytes(data)
+            # Copy to backup so backup_path resolves
+            bk.write_bytes(data)
+        else:
+            for path in (target, bk):
+                if path.exists():
+                    path.unlink()
+
+        fd = _make_file_diff(
+            self.filename,
+            status=status,
+            strategy=MergeStrategy.MERGE,
+            category=FileCategory.COMPOSITE,
+            expected_content=expected,
+            actual_content=(
+                current
+                if status != FileStatus.MISSING
+                else None
+            ),
+        )
 
-            result = _merge_gitignore(plugin, fd, backup)
-            content = target.read_text()
-        return result, content
+        result = self.merge(self.plugin, fd, self.backup)
+        return result, target.read_bytes().decode()
+
+
+class TestMergeGitignore(_MergeTestCase):
+    """Test _merge_gitignore append-only merge logic."""
+
+    filename = ".gitignore"
+    merge = staticmethod(_merge_gitignore)
 
     def test_appends_missing_entries(self):
         """Missing entries appended under update header."""
@@ -351,48 +383,11 @@ class TestMergeGitignore(unittest.TestCase):
         self.assertIn("# Build output", content)
 
 
-class TestMergeMakefile(unittest.TestCase):
+class TestMergeMakefile(_MergeTestCase):
     """Test _merge_makefile conservative target merge."""
 
-    def _run_merge(
-        self,
-        current: str,
-        expected: str,
-        status: FileStatus = FileStatus.OUTDATED,
-    ) -> tuple[PatchResult, str]:
-        """Run a Makefile merge and return result + file.
-
-        Returns:
-            Tuple of (PatchResult, final file content).
-        """
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
-            backup = plugin / ".aida-backup" / "test"
-            backup.mkdir(parents=True)
-
-            target = plugin / "Makefile"
-            if status != FileStatus.MISSING:
-                target.write_text(current)
-                bk = backup / "Makefile"
-                bk.write_text(current)
-
-            fd = _make_file_diff(
-                "Makefile",
-                status=status,
-                strategy=MergeStrategy.MERGE,
-                category=FileCategory.COMPOSITE,
-                expected_content=expected,
-                actual_content=(
-                    current
-                    if status != FileStatus.MISSING
-                    else None
-                ),
-            )
-
-            result = _merge_makefile(plugin, fd, backup)
-            content = target.read_text()
-        return result, content
+    filename = "Makefile"
+    merge = staticmethod(_merge_makefile)
 
     def test_appends_missing_targets(self):
         """Missing targets are appended to the Makefile."""
@@ -462,293 +457,323 @@ class TestMergeMakefile(unittest.TestCase):
 class TestApplyPatches(unittest.TestCase):
     """Test apply_patches end-to-end patching flow."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Write the minimal plugin every test starts from."""
+        super().setUpClass()
+        root = tempfile.mkdtemp(dir=SCRATCH_DIR)
+        cls.addClassCleanup(shutil.rmtree, root, ignore_errors=True)
+        cls._template = Path(root) / "plugin"
+        config_dir = cls._template / ".claude-plugin"
+        config_dir.mkdir(parents=True)
+        (config_dir / "aida-config.json").write_bytes(_OLD_AIDA_CONFIG)
+
     def _setup_plugin(
         self, tmp: str
     ) -> Path:
         """Create a minimal plugin directory.
 
+        The template files are hard-linked, not copied.  That is
+        safe because apply_patches only rewrites them through
+        _atomic_write, which replaces the link with a new file.
+
         Returns:
             Path to the plugin root directory.
         """
-        plugin = Path(tmp) / "plugin"
-        config_dir = plugin / ".claude-plugin"
-        config_dir.mkdir(parents=True)
-        config = config_dir / "aida-config.json"
-        config.write_text(
-            json.dumps(
-                {"generator_version": "0.7.0"}, indent=2
+        return Path(
+            shutil.copytree(
+                self._template,
+                Path(tmp) / "plugin",
+                copy_function=os.link,
             )
-            + "\n"
         )
-        return plugin
 
     def test_add_missing_file(self):
         """MISSING + ADD creates the file with expected content."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-
-            fd = _make_file_diff(
-                "new_file.txt",
-                status=FileStatus.MISSING,
-                strategy=MergeStrategy.ADD,
-                expected_content="brand new content\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+
+        fd = _make_file_diff(
+            "new_file.txt",
+            status=FileStatus.MISSING,
+            strategy=MergeStrategy.ADD,
+            expected_content="brand new content\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            created = plugin / "new_file.txt"
-            self.assertTrue(created.exists())
-            self.assertEqual(
-                created.read_text(), "brand new content\n"
-            )
+        created = plugin / "new_file.txt"
+        self.assertTrue(created.exists())
+        self.assertEqual(
+            created.read_bytes(), b"brand new content\n"
+        )
 
-            actions = [r.action for r in results]
-            self.assertIn("created", actions)
+        actions = [r.action for r in results]
+        self.assertIn("created", actions)
 
     def test_overwrite_outdated_file(self):
         """OUTDATED + OVERWRITE replaces file content."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "stale.txt"
-            target.write_text("old stuff\n")
-
-            fd = _make_file_diff(
-                "stale.txt",
-                status=FileStatus.OUTDATED,
-                strategy=MergeStrategy.OVERWRITE,
-                expected_content="new stuff\n",
-                actual_content="old stuff\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "stale.txt"
+        target.write_bytes(b"old stuff\n")
+
+        fd = _make_file_diff(
+            "stale.txt",
+            status=FileStatus.OUTDATED,
+            strategy=MergeStrategy.OVERWRITE,
+            expected_content="new stuff\n",
+            actual_content="old stuff\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            self.assertEqual(
-                target.read_text(), "new stuff\n"
-            )
-            actions = [r.action for r in results]
-            self.assertIn("updated", actions)
+        self.assertEqual(
+            target.read_bytes(), b"new stuff\n"
+        )
+        actions = [r.action for r in results]
+        self.assertIn("updated", actions)
 
     def test_skip_custom_file(self):
         """CUSTOM_SKIP files are not actionable."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "custom.txt"
-            target.write_text("my stuff\n")
-
-            fd = _make_file_diff(
-                "custom.txt",
-                status=FileStatus.CUSTOM_SKIP,
-                strategy=MergeStrategy.SKIP,
-                actual_content="my stuff\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "custom.txt"
+        target.write_bytes(b"my stuff\n")
+
+        fd = _make_file_diff(
+            "custom.txt",
+            status=FileStatus.CUSTOM_SKIP,
+            strategy=MergeStrategy.SKIP,
+            actual_content="my stuff\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            # File unchanged
-            self.assertEqual(
-                target.read_text(), "my stuff\n"
-            )
-            # Only result is the version update
-            paths = [r.path for r in results]
-            self.assertNotIn("custom.txt", paths)
+        # File unchanged
+        self.assertEqual(
+            target.read_bytes(), b"my stuff\n"
+        )
+        # Only result is the version update
+        paths = [r.path for r in results]
+        self.assertNotIn("custom.txt", paths)
 
     def test_skip_up_to_date_file(self):
         """UP_TO_DATE files are filtered out entirely."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "current.txt"
-            target.write_text("perfect\n")
-
-            fd = _make_file_diff(
-                "current.txt",
-                status=FileStatus.UP_TO_DATE,
-                strategy=MergeStrategy.SKIP,
-                expected_content="perfect\n",
-                actual_content="perfect\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "current.txt"
+        target.write_bytes(b"perfect\n")
+
+        fd = _make_file_diff(
+            "current.txt",
+            status=FileStatus.UP_TO_DATE,
+            strategy=MergeStrategy.SKIP,
+            expected_content="perfect\n",
+            actual_content="perfect\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            paths = [r.path for r in results]
-            self.assertNotIn("current.txt", paths)
+        paths = [r.path for r in results]
+        self.assertNotIn("current.txt", paths)
 
     def test_manual_review_not_modified(self):
         """MANUAL_REVIEW files are skipped without changes."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "complex.toml"
-            target.write_text("original\n")
-
-            fd = _make_file_diff(
-                "complex.toml",
-                status=FileStatus.OUTDATED,
-                strategy=MergeStrategy.MANUAL_REVIEW,
-                expected_content="updated\n",
-                actual_content="original\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "complex.toml"
+        target.write_bytes(b"original\n")
+
+        fd = _make_file_diff(
+            "complex.toml",
+            status=FileStatus.OUTDATED,
+            strategy=MergeStrategy.MANUAL_REVIEW,
+            expected_content="updated\n",
+            actual_content="original\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            # File is not modified
-            self.assertEqual(
-                target.read_text(), "original\n"
-            )
-            # Result shows skipped
-            manual = [
-                r
-                for r in results
-                if r.path == "complex.toml"
-            ]
-            self.assertEqual(len(manual), 1)
-            self.assertEqual(manual[0].action, "skipped")
+        # File is not modified
+        self.assertEqual(
+            target.read_bytes(), b"original\n"
+        )
+        # Result shows skipped
+        manual = [
+            r
+            for r in results
+            if r.path == "complex.toml"
+        ]
+        self.assertEqual(len(manual), 1)
+        self.assertEqual(manual[0].action, "skipped")
 
     def test_add_skips_existing_file(self):
         """ADD strategy does not overwrite existing files."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "exists.txt"
-            target.write_text("keep me\n")
-
-            fd = _make_file_diff(
-                "exists.txt",
-                status=FileStatus.MISSING,
-                strategy=MergeStrategy.ADD,
-                expected_content="replacement\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            results = apply_patches(plugin, report)
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "exists.txt"
+        target.write_bytes(b"keep me\n")
+
+        fd = _make_file_diff(
+            "exists.txt",
+            status=FileStatus.MISSING,
+            strategy=MergeStrategy.ADD,
+            expected_content="replacement\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        results = apply_patches(plugin, report)
 
-            # File content unchanged
-            self.assertEqual(
-                target.read_text(), "keep me\n"
-            )
-            add_result = [
-                r
-                for r in results
-                if r.path == "exists.txt"
-            ]
-            self.assertEqual(len(add_result), 1)
-            self.assertEqual(
-                add_result[0].action, "skipped"
-            )
+        # File content unchanged
+        self.assertEqual(
+            target.read_bytes(), b"keep me\n"
+        )
+        add_result = [
+            r
+            for r in results
+            if r.path == "exists.txt"
+        ]
+        self.assertEqual(len(add_result), 1)
+        self.assertEqual(
+            add_result[0].action, "skipped"
+        )
 
     def test_user_override_to_skip(self):
         """Override dict can force SKIP on a file."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "override.txt"
-            target.write_text("original\n")
-
-            fd = _make_file_diff(
-                "override.txt",
-                status=FileStatus.OUTDATED,
-                strategy=MergeStrategy.OVERWRITE,
-                expected_content="new\n",
-                actual_content="original\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            overrides = {
-                "override.txt": MergeStrategy.SKIP
-            }
-            results = apply_patches(
-                plugin, report, overrides=overrides
-            )
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "override.txt"
+        target.write_bytes(b"original\n")
+
+        fd = _make_file_diff(
+            "override.txt",
+            status=FileStatus.OUTDATED,
+            strategy=MergeStrategy.OVERWRITE,
+            expected_content="new\n",
+            actual_content="original\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        overrides = {
+            "override.txt": MergeStrategy.SKIP
+        }
+        results = apply_patches(
+            plugin, report, overrides=overrides
+        )
 
-            # File not modified
-            self.assertEqual(
-                target.read_text(), "original\n"
-            )
-            skip_result = [
-                r
-                for r in results
-                if r.path == "override.txt"
-            ]
-            self.assertEqual(len(skip_result), 1)
-            self.assertEqual(
-                skip_result[0].action, "skipped"
-            )
+        # File not modified
+        self.assertEqual(
+            target.read_bytes(), b"original\n"
+        )
+        skip_result = [
+            r
+            for r in results
+            if r.path == "override.txt"
+        ]
+        self.assertEqual(len(skip_result), 1)
+        self.assertEqual(
+            skip_result[0].action, "skipped"
+        )
 
     def test_backup_created(self):
         """Patching OUTDATED files creates a backup dir."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-            target = plugin / "old.txt"
-            target.write_text("before\n")
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        target = plugin / "old.txt"
+        target.write_bytes(b"before\n")
+
+        fd = _make_file_diff(
+            "old.txt",
+            status=FileStatus.OUTDATED,
+            strategy=MergeStrategy.OVERWRITE,
+            expected_content="after\n",
+            actual_content="before\n",
+        )
+        report = _make_diff_report(
+            str(plugin), files=[fd]
+        )
+        apply_patches(plugin, report)
 
-            fd = _make_file_diff(
-                "old.txt",
+        # At least one timestamped subdirectory
+        subdirs = _entries(plugin / ".aida-backup")
+        self.assertGreater(len(subdirs), 0)
+        for name, entry in subdirs.items():
+            self.assertTrue(entry.is_dir(follow_symlinks=False))
+            self.assertRegex(name, _BACKUP_TIMESTAMP_RE)
+
+    def test_results_include_all_files(self):
+        """Every actionable file gets a PatchResult."""
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+
+        # Create existing file for the OUTDATED entry
+        (plugin / "b.txt").write_bytes(b"old\n")
+
+        files = [
+            _make_file_diff(
+                "a.txt",
+                status=FileStatus.MISSING,
+                strategy=MergeStrategy.ADD,
+                expected_content="a\n",
+            ),
+            _make_file_diff(
+                "b.txt",
                 status=FileStatus.OUTDATED,
                 strategy=MergeStrategy.OVERWRITE,
-                expected_content="after\n",
-                actual_content="before\n",
-            )
-            report = _make_diff_report(
-                str(plugin), files=[fd]
-            )
-            apply_patches(plugin, report)
+                expected_content="b\n",
+                actual_content="old\n",
+            ),
+            _make_file_diff(
+                "c.txt",
+                status=FileStatus.MISSING,
+                strategy=MergeStrategy.ADD,
+                expected_content="c\n",
+            ),
+        ]
+        report = _make_diff_report(
+            str(plugin), files=files
+        )
+        results = apply_patches(plugin, report)
+
+        paths = [r.path for r in results]
+        self.assertIn("a.txt", paths)
+        self.assertIn("b.txt", paths)
+        self.assertIn("c.txt", paths)
+        # Plus the version update
+        self.assertIn(
+            ".claude-plugin/aida-config.json", paths
+        )
 
-            backup_dir = plugin / ".aida-backup"
-            self.assertTrue(backup_dir.exists())
-            # At least one timestamped subdirectory
-            subdirs = list(backup_dir.iterdir())
-            self.assertGreater(len(subdirs), 0)
 
-    def test_results_include_all_files(self):
-        """Every actionable file gets a PatchResult."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = self._setup_plugin(tmp)
-
-            # Create existing file for the OUTDATED entry
-            (plugin / "b.txt").write_text("old\n")
-
-            files = [
-                _make_file_diff(
-                    "a.txt",
-                    status=FileStatus.MISSING,
-                    strategy=MergeStrategy.ADD,
-                    expected_content="a\n",
-                ),
-                _make_file_diff(
-                    "b.txt",
-                    status=FileStatus.OUTDATED,
-                    strategy=MergeStrategy.OVERWRITE,
-                    expected_content="b\n",
-                    actual_content="old\n",
-                ),
-                _make_file_diff(
-                    "c.txt",
-                    status=FileStatus.MISSING,
-                    strategy=MergeStrategy.ADD,
-                    expected_content="c\n",
-                ),
-            ]
-            report = _make_diff_report(
-                str(plugin), files=files
-            )
-            results = apply_patches(plugin, report)
-
-            paths = [r.path for r in results]
-            self.assertIn("a.txt", paths)
-            self.assertIn("b.txt", paths)
-            self.assertIn("c.txt", paths)
-            # Plus the version update
-            self.assertIn(
-                ".claude-plugin/aida-config.json", paths
-            )
+    def test_version_update_leaves_template_intact(self):
+        """Rewriting a linked config must not reach the template."""
+        template_config = (
+            self._template / ".claude-plugin" / "aida-config.json"
+        )
+        original = template_config.read_bytes()
+        tmp = make_tmp(self)
+        plugin = self._setup_plugin(tmp)
+        apply_patches(plugin, _make_diff_report(str(plugin)))
+
+        config = plugin / ".claude-plugin" / "aida-config.json"
+        self.assertEqual(
+            json.loads(config.read_bytes())["generator_version"],
+            GENERATOR_VERSION,
+        )
+        self.assertEqual(template_config.read_bytes(), original)
 
 
 class TestUpdateGeneratorVersion(unittest.TestCase):
@@ -756,78 +781,72 @@ class TestUpdateGeneratorVersion(unittest.TestCase):
 
     def test_updates_existing_aida_config(self):
         """Existing config gets its version updated."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            config_dir = plugin / ".claude-plugin"
-            config_dir.mkdir(parents=True)
-            config = config_dir / "aida-config.json"
-            config.write_text(
-                json.dumps(
-                    {"generator_version": "0.5.0"},
-                    indent=2,
-                )
-                + "\n"
-            )
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        config_dir = plugin / ".claude-plugin"
+        config_dir.mkdir(parents=True)
+        config = config_dir / "aida-config.json"
+        config.write_bytes(_OLD_AIDA_CONFIG)
 
-            result = _update_generator_version(plugin)
+        result = _update_generator_version(plugin)
 
-            data = json.loads(config.read_text())
-            self.assertEqual(
-                data["generator_version"],
-                GENERATOR_VERSION,
-            )
-            self.assertEqual(result.action, "updated")
+        data = json.loads(config.read_text())
+        self.assertEqual(
+            data["generator_version"],
+            GENERATOR_VERSION,
+        )
+        self.assertEqual(result.action, "updated")
 
     def test_creates_aida_config_if_missing(self):
         """Missing config file is created with version."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            plugin.mkdir()
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        plugin.mkdir()
 
-            result = _update_generator_version(plugin)
+        result = _update_generator_version(plugin)
 
-            config = (
-                plugin
-                / ".claude-plugin"
-                / "aida-config.json"
-            )
-            self.assertTrue(config.exists())
-            data = json.loads(config.read_text())
-            self.assertEqual(
-                data["generator_version"],
-                GENERATOR_VERSION,
-            )
-            self.assertEqual(result.action, "updated")
+        config = (
+            plugin
+            / ".claude-plugin"
+            / "aida-config.json"
+        )
+        self.assertTrue(config.exists())
+        data = json.loads(config.read_text())
+        self.assertEqual(
+            data["generator_version"],
+            GENERATOR_VERSION,
+        )
+        self.assertEqual(result.action, "updated")
 
     def test_preserves_other_fields(self):
         """Non-version fields survive the update."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin = Path(tmp) / "plugin"
-            config_dir = plugin / ".claude-plugin"
-            config_dir.mkdir(parents=True)
-            config = config_dir / "aida-config.json"
-            original = {
-                "generator_version": "0.5.0",
-                "config": {"theme": "dark"},
-                "permissions": ["read", "write"],
-            }
-            config.write_text(
-                json.dumps(original, indent=2) + "\n"
-            )
+        tmp = make_tmp(self)
+        plugin = Path(tmp) / "plugin"
+        config_dir = plugin / ".claude-plugin"
+        config_dir.mkdir(parents=True)
+        config = config_dir / "aida-config.json"
+        original = {
+            "generator_version": "0.5.0",
+            "config": {"theme": "dark"},
+            "permissions": ["read", "write"],
+        }
+        config.write_text(
+            json.dumps(original, indent=2) + "\n"
+        )
 
-            _update_generator_version(plugin)
+        _update_generator_version(plugin)
 
-            data = json.loads(config.read_text())
-            self.assertEqual(
-                data["generator_version"],
-                GENERATOR_VERSION,
-            )
-            self.assertEqual(
-                data["config"], {"theme": "dark"}
-            )
-            self.assertEqual(
-                data["permissions"], ["read", "write"]
-            )
+        data = json.loads(config.read_text())
+        self.assertEqual(
+            data["generator_version"],
+            GENERATOR_VERSION,
+        )
+        self.assertEqual(
+            data["config"], {"theme": "dark"}
+        )
+        self.assertEqual(
+            data["permissions"], ["read", "write"]
+        )
 
 
 class TestParsers(unittest.TestCase):
@@ -981,48 +1000,67 @@ class TestExtractMakefileTargetBlock(unittest.TestCase):
 class TestScannerErrorFallback(unittest.TestCase):
     """Test scanner error fallback path."""
 
+    def _make_plugin(self, **metadata) -> Path:
+        """Create a minimal plugin; ``metadata`` extends plugin.json."""
+        plugin_dir = Path(make_tmp(self)) / "plugin"
+        meta_dir = plugin_dir / ".claude-plugin"
+        meta_dir.mkdir(parents=True)
+        (meta_dir / "plugin.json").write_text(
+            json.dumps({
+                "name": "test",
+                "version": "0.1.0",
+                "description": "Test plugin for testing",
+                **metadata,
+            })
+        )
+        (meta_dir / "aida-config.json").write_text(
+            json.dumps({"generator_version": "0.9.0"})
+        )
+        (plugin_dir / "pyproject.toml").write_text("")
+        return plugin_dir
+
+    def test_render_error_marks_outdated(self):
+        """A template that fails to render should mark OUTDATED."""
+        # A complete author keeps git out of the scan
+        plugin_dir = self._make_plugin(
+            author={"name": "Test", "email": "test@test.com"}
+        )
+        with patch.object(
+            _scanner_mod, "render_template",
+            side_effect=RuntimeError("boom"),
+        ):
+            report = scan_plugin(plugin_dir, SCAFFOLD_TEMPLATES)
+
+        by_path = {f.path: f for f in report.files}
+        diff = by_path[".markdownlint.json"]
+        self.assertEqual(diff.status, FileStatus.OUTDATED)
+        self.assertIn("Error", diff.diff_summary)
+
     def test_comparison_error_marks_outdated(self):
         """File comparison error should mark as OUTDATED."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "plugin"
-            plugin_dir.mkdir()
-
-            # Create a minimal plugin
-            meta_dir = plugin_dir / ".claude-plugin"
-            meta_dir.mkdir()
-            (meta_dir / "plugin.json").write_text(
-                json.dumps({
-                    "name": "test",
-                    "version": "0.1.0",
-                    "description": "Test plugin for testing",
-                })
-            )
-            (meta_dir / "aida-config.json").write_text(
-                json.dumps({"generator_version": "0.9.0"})
-            )
-            (plugin_dir / "pyproject.toml").write_text("")
+        plugin_dir = self._make_plugin()
 
-            # Use a bogus templates dir to trigger errors
-            bogus_templates = Path(tmp) / "no-templates"
-            bogus_templates.mkdir()
+        # Use a bogus templates dir to trigger errors
+        bogus_templates = plugin_dir.parent / "no-templates"
+        bogus_templates.mkdir()
 
-            report = scan_plugin(
-                plugin_dir, bogus_templates
-            )
-            # Templated files should be marked as OUTDATED
-            # due to template rendering errors
-            errored = [
-                f
-                for f in report.files
-                if f.status == FileStatus.OUTDATED
-                and "Error" in f.diff_summary
-            ]
-            self.assertGreater(
-                len(errored),
-                0,
-                "Expected at least one file marked OUTDATED "
-                "due to comparison error",
-            )
+        report = scan_plugin(
+            plugin_dir, bogus_templates
+        )
+        # Templated files should be marked as OUTDATED
+        # due to template rendering errors
+        errored = [
+            f
+            for f in report.files
+            if f.status == FileStatus.OUTDATED
+            and "Error" in f.diff_summary
+        ]
+        self.assertGreater(
+            len(errored),
+            0,
+            "Expected at least one file marked OUTDATED "
+            "due to comparison error",
+        )
 
 
 if __name__ == "__main__":
@@ -6,30 +6,25 @@
 from __future__ import annotations
 
 import json
-import sys
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
-# Add scripts directories to path
-_project_root = Path(__file__).parent.parent.parent
-_plugin_scripts = (
-    _project_root / "skills" / "plugin-manager" / "scripts"
+from _scaffold_bootstrap import (
+    SCAFFOLD_TEMPLATES,
+    SCRATCH_DIR,
+    make_tmp,
+    prepare_plugin_manager_imports,
+    snapshot_operations,
 )
-sys.path.insert(0, str(_project_root / "scripts"))
-sys.path.insert(0, str(_plugin_scripts))
-
-# Clear cached operations modules to avoid cross-manager
-# conflicts in pytest
-for _mod_name in list(sys.modules):
-    if _mod_name == "operations" or _mod_name.startswith(
-        "operations."
-    ):
-        del sys.modules[_mod_name]
-sys.modules.pop("_paths", None)
+
+prepare_plugin_manager_imports()
 
 from operations.update_ops.scanner import (  # noqa: E402
+    _build_scan_context,
     _detect_language,
     _read_generator_version,
     _read_plugin_metadata,
@@ -45,20 +40,33 @@ from operations.constants import (  # noqa: E402
 )
 import operations.scaffold_ops.context as _context_mod  # noqa: E402
 
-_ops_snapshot = {
-    k: v for k, v in sys.modules.items()
-    if k == "operations" or k.startswith("operations.")
-}
+_ops_snapshot = snapshot_operations()
 
-TEMPLATES_DIR = (
-    _plugin_scripts.parent / "templates" / "scaffold"
-)
+TEMPLATES_DIR = SCAFFOLD_TEMPLATES
 
 _GIT_MOCK_RETURN = {
     "author_name": "Test Author",
     "author_email": "test@test.com",
 }
 
+# The scanner only json.loads these files, so skip pretty-printing
+_COMPACT = (",", ":")
+
+
+def setUpModule():
+    """Stub out git author lookup for the whole module.
+
+    Test plugins carry a string author, so every scan falls back to
+    ``infer_git_config``.  Tests that assert on the lookup patch it
+    again locally.
+    """
+    patcher = patch.object(
+        _context_mod, "infer_git_config",
+        return_value=_GIT_MOCK_RETURN,
+    )
+    patcher.start()
+    unittest.addModuleCleanup(patcher.stop)
+
 
 def _create_test_plugin(
     base_dir: Path,
@@ -83,8 +91,8 @@ def _create_test_plugin(
         "keywords": ["test"],
         "repository": "",
     }
-    (meta_dir / "plugin.json").write_text(
-        json.dumps(plugin_json, indent=2)
+    (meta_dir / "plugin.json").write_bytes(
+        json.dumps(plugin_json, separators=_COMPACT).encode()
     )
 
     # .claude-plugin/aida-config.json
@@ -96,18 +104,18 @@ def _create_test_plugin(
     }
     if generator_version is not None:
         aida_config["generator_version"] = generator_version
-    (meta_dir / "aida-config.json").write_text(
-        json.dumps(aida_config, indent=2)
+    (meta_dir / "aida-config.json").write_bytes(
+        json.dumps(aida_config, separators=_COMPACT).encode()
     )
 
     # Language marker
     if language == "python":
-        (plugin_dir / "pyproject.toml").write_text(
-            '[project]\nname = "test-plugin"\n'
+        (plugin_dir / "pyproject.toml").write_bytes(
+            b'[project]\nname = "test-plugin"\n'
         )
     else:
-        (plugin_dir / "package.json").write_text(
-            '{"name": "test-plugin"}\n'
+        (plugin_dir / "package.json").write_bytes(
+            b'{"name": "test-plugin"}\n'
         )
 
     return plugin_dir
@@ -118,35 +126,35 @@ class TestReadPluginMetadata(unittest.TestCase):
 
     def test_reads_valid_plugin_json(self):
         """Should read and return parsed plugin.json fields."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            result = _read_plugin_metadata(plugin_dir)
+        tmp = make_tmp(self)
+        plugin_dir = _create_test_plugin(Path(tmp))
+        result = _read_plugin_metadata(plugin_dir)
 
-            self.assertEqual(result["name"], "test-plugin")
-            self.assertEqual(result["version"], "0.1.0")
-            self.assertEqual(result["license"], "MIT")
-            self.assertIn("description", result)
+        self.assertEqual(result["name"], "test-plugin")
+        self.assertEqual(result["version"], "0.1.0")
+        self.assertEqual(result["license"], "MIT")
+        self.assertIn("description", result)
 
     def test_returns_empty_on_missing_file(self):
         """Should return empty dict when plugin.json is absent."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "no-plugin"
-            plugin_dir.mkdir()
-            result = _read_plugin_metadata(plugin_dir)
-            self.assertEqual(result, {})
+        tmp = make_tmp(self)
+        plugin_dir = Path(tmp) / "no-plugin"
+        plugin_dir.mkdir()
+        result = _read_plugin_metadata(plugin_dir)
+        self.assertEqual(result, {})
 
     def test_returns_empty_on_invalid_json(self):
         """Should return empty dict on malformed JSON."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "bad-json"
-            plugin_dir.mkdir()
-            meta_dir = plugin_dir / ".claude-plugin"
-            meta_dir.mkdir()
-            (meta_dir / "plugin.json").write_text(
-                "{not valid json!!"
-            )
-            result = _read_plugin_metadata(plugin_dir)
-            self.assertEqual(result, {})
+        tmp = make_tmp(self)
+        plugin_dir = Path(tmp) / "bad-json"
+        plugin_dir.mkdir()
+        meta_dir = plugin_dir / ".claude-plugin"
+        meta_dir.mkdir()
+        (meta_dir / "plugin.json").write_bytes(
+            b"{not valid json!!"
+        )
+        result = _read_plugin_metadata(plugin_dir)
+        self.assertEqual(result, {})
 
 
 class TestReadGeneratorVersion(unittest.TestCase):
@@ -154,507 +162,416 @@ class TestReadGeneratorVersion(unittest.TestCase):
 
     def test_reads_version_from_aida_config(self):
         """Should read generator_version from aida-config."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(
-                Path(tmp),
-                generator_version="1.2.3",
-            )
-            result = _read_generator_version(plugin_dir)
-            self.assertEqual(result, "1.2.3")
+        tmp = make_tmp(self)
+        plugin_dir = _create_test_plugin(
+            Path(tmp),
+            generator_version="1.2.3",
+        )
+        result = _read_generator_version(plugin_dir)
+        self.assertEqual(result, "1.2.3")
 
     def test_defaults_to_zero_on_missing_file(self):
         """Should return 0.0.0 when aida-config is absent."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "no-config"
-            plugin_dir.mkdir()
-            (plugin_dir / ".claude-plugin").mkdir()
-            result = _read_generator_version(plugin_dir)
-            self.assertEqual(result, "0.0.0")
+        tmp = make_tmp(self)
+        plugin_dir = Path(tmp) / "no-config"
+        plugin_dir.mkdir()
+        (plugin_dir / ".claude-plugin").mkdir()
+        result = _read_generator_version(plugin_dir)
+        self.assertEqual(result, "0.0.0")
 
     def test_defaults_to_zero_on_missing_field(self):
         """Should return 0.0.0 when field is absent."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(
-                Path(tmp),
-                generator_version=None,
-            )
-            result = _read_generator_version(plugin_dir)
-            self.assertEqual(result, "0.0.0")
+        tmp = make_tmp(self)
+        plugin_dir = _create_test_plugin(
+            Path(tmp),
+            generator_version=None,
+        )
+        result = _read_generator_version(plugin_dir)
+        self.assertEqual(result, "0.0.0")
+
+
+class _FakePluginDir:
+    """In-memory plugin directory for ``_detect_language``.
+
+    Supports only ``/`` followed by ``exists()`` or ``is_dir()``.
+    """
+
+    def __init__(self, files=(), dirs=()):
+        self._files = frozenset(files)
+        self._dirs = frozenset(dirs)
+
+    def __truediv__(self, name):
+        is_dir = name in self._dirs
+        exists = is_dir or name in self._files
+        return SimpleNamespace(
+            exists=lambda: exists, is_dir=lambda: is_dir
+        )
 
 
 class TestDetectLanguage(unittest.TestCase):
     """Test _detect_language helper."""
 
     def test_detects_python_from_pyproject(self):
-        """Should detect python from pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "py-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / "pyproject.toml").write_text("")
-            self.assertEqual(
-                _detect_language(plugin_dir), "python"
-            )
-
-    def test_detects_typescript_from_package_json(self):
-        """Should detect typescript from package.json."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "ts-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / "package.json").write_text("{}")
-            self.assertEqual(
-                _detect_language(plugin_dir), "typescript"
-            )
-
-    def test_detects_python_from_scripts_dir(self):
-        """Should detect python from scripts/ directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "scripts-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / "scripts").mkdir()
-            self.assertEqual(
-                _detect_language(plugin_dir), "python"
-            )
-
-    def test_detects_typescript_from_src_dir(self):
-        """Should detect typescript from src/ directory."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "src-plugin"
-            plugin_dir.mkdir()
-            (plugin_dir / "src").mkdir()
-            self.assertEqual(
-                _detect_language(plugin_dir), "typescript"
-            )
-
-    def test_defaults_to_python(self):
-        """Should default to python for empty directories."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "empty-plugin"
-            plugin_dir.mkdir()
-            self.assertEqual(
-                _detect_language(plugin_dir), "python"
-            )
-
-
-class TestScanPluginValid(unittest.TestCase):
-    """Test scan_plugin with a valid plugin directory."""
+        """Should detect python from a real pyproject.toml."""
+        tmp = make_tmp(self)
+        plugin_dir = Path(tmp) / "py-plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "pyproject.toml").write_bytes(b"")
+        self.assertEqual(
+            _detect_language(plugin_dir), "python"
+        )
+
+    def test_detects_language_from_layout(self):
+        """Should pick the language from the plugin's layout."""
+        cases = (
+            ("pyproject.toml", _FakePluginDir(
+                files=["pyproject.toml"]), "python"),
+            ("package.json", _FakePluginDir(
+                files=["package.json"]), "typescript"),
+            ("scripts/", _FakePluginDir(dirs=["scripts"]), "python"),
+            ("src/", _FakePluginDir(dirs=["src"]), "typescript"),
+            ("empty", _FakePluginDir(), "python"),
+        )
+        for layout, plugin_dir, expected in cases:
+            with self.subTest(layout=layout):
+                self.assertEqual(
+                    _detect_language(plugin_dir), expected
+                )
+
+
+class TestBuildScanContext(unittest.TestCase):
+    """Test author resolution in _build_scan_context."""
+
+    @patch.object(_context_mod, "infer_git_config")
+    def test_complete_author_skips_git(self, mock_git):
+        """Git is not consulted when plugin.json has name and email."""
+        metadata = {
+            "name": "p",
+            "author": {"name": "Ada", "email": "ada@example.com"},
+        }
+        context = _build_scan_context(Path("."), metadata, "python")
+        mock_git.assert_not_called()
+        self.assertEqual(context["author_name"], "Ada")
+        self.assertEqual(context["author_email"], "ada@example.com")
 
     @patch.object(
         _context_mod, "infer_git_config",
         return_value=_GIT_MOCK_RETURN,
     )
-    def test_scan_reports_correct_plugin_name(
-        self, _mock_git
-    ):
+    def test_missing_email_falls_back_to_git(self, mock_git):
+        """A string author has no email, so git fills it in."""
+        metadata = {"name": "p", "author": "Ada"}
+        context = _build_scan_context(Path("."), metadata, "python")
+        mock_git.assert_called_once()
+        self.assertEqual(context["author_name"], "Ada")
+        self.assertEqual(context["author_email"], "test@test.com")
+
+
+# Pristine test plugin and its scan, shared by the whole module
+_BASE_PLUGIN_NAME = "my-scanner-test"
+_baseline: dict = {}
+
+
+def tearDownModule():
+    """Remove the shared test plugin."""
+    root = _baseline.pop("root", None)
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
+    _baseline.clear()
+
+
+def _base_plugin() -> Path:
+    """Return the module's unmodified test plugin, creating it once."""
+    plugin = _baseline.get("plugin")
+    if plugin is None:
+        root = _baseline["root"] = tempfile.mkdtemp(dir=SCRATCH_DIR)
+        plugin = _baseline["plugin"] = _create_test_plugin(
+            Path(root), name=_BASE_PLUGIN_NAME
+        )
+    return plugin
+
+
+def _base_report():
+    """Return the scan of the unmodified test plugin, scanning once."""
+    report = _baseline.get("report")
+    if report is None:
+        report = _baseline["report"] = scan_plugin(
+            _base_plugin(), TEMPLATES_DIR
+        )
+    return report
+
+
+class _ScanTestCase(unittest.TestCase):
+    """Scan tests over the module's shared test plugin.
+
+    Tests that only read the scan of the unmodified plugin use
+    ``_base_report()``.  Tests that write files scan a private copy
+    from ``_copy_plugin()``.
+    """
+
+    def _copy_plugin(self) -> Path:
+        """Copy the pristine plugin into a temp dir for this test."""
+        base = _base_plugin()
+        target = Path(make_tmp(self)) / base.name
+        return Path(shutil.copytree(base, target))
+
+
+class TestScanPluginValid(_ScanTestCase):
+    """Test scan_plugin with a valid plugin directory."""
+
+    def test_scan_reports_correct_plugin_name(self):
         """Should report the correct plugin name."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(
-                Path(tmp), name="my-scanner-test"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            self.assertEqual(
-                report.plugin_name, "my-scanner-test"
-            )
+        report = _base_report()
+        self.assertEqual(
+            report.plugin_name, "my-scanner-test"
+        )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_scan_reports_correct_language(
-        self, _mock_git
-    ):
+    def test_scan_reports_correct_language(self):
         """Should report the detected language."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            self.assertEqual(report.language, "python")
+        report = _base_report()
+        self.assertEqual(report.language, "python")
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_scan_reports_generator_version(
-        self, _mock_git
-    ):
+    def test_scan_reports_generator_version(self):
         """Should report the plugin generator_version."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(
-                Path(tmp), generator_version="0.5.0"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            self.assertEqual(
-                report.generator_version, "0.5.0"
-            )
-            self.assertEqual(
-                report.current_version, GENERATOR_VERSION
-            )
+        tmp = make_tmp(self)
+        plugin_dir = _create_test_plugin(
+            Path(tmp), generator_version="0.5.0"
+        )
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        self.assertEqual(
+            report.generator_version, "0.5.0"
+        )
+        self.assertEqual(
+            report.current_version, GENERATOR_VERSION
+        )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_scan_up_to_date_boilerplate(
-        self, _mock_git
-    ):
+    def test_scan_up_to_date_boilerplate(self):
         """Should report files correctly across categories."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            # The report should have files
-            self.assertGreater(len(report.files), 0)
-            # Check that summary counts are consistent
-            summary = report.summary
-            total = (
-                summary["missing"]
-                + summary["outdated"]
-                + summary["up_to_date"]
-                + summary["custom_skip"]
-            )
-            self.assertEqual(total, summary["total"])
-
-
-class TestScanPluginMissingFiles(unittest.TestCase):
-    """Test scan_plugin detects missing files."""
+        report = _base_report()
+        # The report should have files
+        self.assertGreater(len(report.files), 0)
+        # Check that summary counts are consistent
+        summary = report.summary
+        total = (
+            summary["missing"]
+            + summary["outdated"]
+            + summary["up_to_date"]
+            + summary["custom_skip"]
+        )
+        self.assertEqual(total, summary["total"])
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_missing_markdownlint_detected(
-        self, _mock_git
-    ):
-        """Should detect missing .markdownlint.json."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            # Ensure .markdownlint.json does NOT exist
-            ml_path = plugin_dir / ".markdownlint.json"
-            if ml_path.exists():
-                ml_path.unlink()
-
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            ml_diffs = [
-                f
-                for f in report.files
-                if f.path == ".markdownlint.json"
-            ]
-            self.assertEqual(len(ml_diffs), 1)
-            self.assertEqual(
-                ml_diffs[0].status, FileStatus.MISSING
-            )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_missing_gitignore_detected(
-        self, _mock_git
-    ):
-        """Should detect missing .gitignore."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            gi_diffs = [
-                f
-                for f in report.files
-                if f.path == ".gitignore"
-            ]
-            self.assertEqual(len(gi_diffs), 1)
-            self.assertEqual(
-                gi_diffs[0].status, FileStatus.MISSING
-            )
+class TestScanPluginMissingFiles(_ScanTestCase):
+    """Test scan_plugin detects missing files."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_missing_makefile_detected(
-        self, _mock_git
-    ):
-        """Should detect missing Makefile."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            mf_diffs = [
-                f
-                for f in report.files
-                if f.path == "Makefile"
-            ]
-            self.assertEqual(len(mf_diffs), 1)
-            self.assertEqual(
-                mf_diffs[0].status, FileStatus.MISSING
-            )
-
-
-class TestScanPluginCustomFiles(unittest.TestCase):
+    def test_missing_boilerplate_detected(self):
+        """Should detect each boilerplate file the plugin lacks."""
+        report = _base_report()
+        by_path = {f.path: f for f in report.files}
+        # The test plugin never writes any of these
+        for path in (".markdownlint.json", ".gitignore", "Makefile"):
+            with self.subTest(path=path):
+                self.assertFalse((_base_plugin() / path).exists())
+                self.assertIn(path, by_path)
+                self.assertEqual(
+                    by_path[path].status, FileStatus.MISSING
+                )
+
+
+class TestScanPluginCustomFiles(_ScanTestCase):
     """Test scan_plugin marks custom files correctly."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_claudemd_always_custom_skip(
-        self, _mock_git
-    ):
-        """Should mark CLAUDE.md as CUSTOM_SKIP."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            (plugin_dir / "CLAUDE.md").write_text(
-                "# Custom content"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            claude_diffs = [
-                f
-                for f in report.files
-                if f.path == "CLAUDE.md"
-            ]
-            self.assertEqual(len(claude_diffs), 1)
-            self.assertEqual(
-                claude_diffs[0].status,
-                FileStatus.CUSTOM_SKIP,
-            )
+    def test_user_docs_always_custom_skip(self):
+        """Should mark CLAUDE.md and README.md as CUSTOM_SKIP."""
+        plugin_dir = self._copy_plugin()
+        (plugin_dir / "CLAUDE.md").write_bytes(
+            b"# Custom content"
+        )
+        (plugin_dir / "README.md").write_bytes(
+            b"# My Plugin"
+        )
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        by_path = {f.path: f for f in report.files}
+        for path in ("CLAUDE.md", "README.md"):
+            with self.subTest(path=path):
+                self.assertIn(path, by_path)
+                self.assertEqual(
+                    by_path[path].status,
+                    FileStatus.CUSTOM_SKIP,
+                )
+
+    def test_aida_config_always_custom_skip(self):
+        """Should mark aida-config.json as CUSTOM_SKIP."""
+        report = _base_report()
+        aida_diffs = [
+            f
+            for f in report.files
+            if f.path
+            == ".claude-plugin/aida-config.json"
+        ]
+        self.assertEqual(len(aida_diffs), 1)
+        self.assertEqual(
+            aida_diffs[0].status,
+            FileStatus.CUSTOM_SKIP,
+        )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_readme_always_custom_skip(
-        self, _mock_git
-    ):
-        """Should mark README.md as CUSTOM_SKIP."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            (plugin_dir / "README.md").write_text(
-                "# My Plugin"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            readme_diffs = [
-                f
-                for f in report.files
-                if f.path == "README.md"
-            ]
-            self.assertEqual(len(readme_diffs), 1)
-            self.assertEqual(
-                readme_diffs[0].status,
-                FileStatus.CUSTOM_SKIP,
-            )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_aida_config_always_custom_skip(
-        self, _mock_git
-    ):
-        """Should mark aida-config.json as CUSTOM_SKIP."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            aida_diffs = [
-                f
-                for f in report.files
-                if f.path
-                == ".claude-plugin/aida-config.json"
-            ]
-            self.assertEqual(len(aida_diffs), 1)
-            self.assertEqual(
-                aida_diffs[0].status,
-                FileStatus.CUSTOM_SKIP,
-            )
-
-
-class TestScanPluginOutdated(unittest.TestCase):
+class TestScanPluginOutdated(_ScanTestCase):
     """Test scan_plugin detects outdated boilerplate."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_outdated_boilerplate_detected(
-        self, _mock_git
-    ):
+    def test_outdated_boilerplate_detected(self):
         """Should detect outdated .markdownlint.json."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            # Write a .markdownlint.json with different
-            # content from the template
-            (plugin_dir / ".markdownlint.json").write_text(
-                '{"old": "config"}\n'
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            ml_diffs = [
-                f
-                for f in report.files
-                if f.path == ".markdownlint.json"
-            ]
-            self.assertEqual(len(ml_diffs), 1)
-            self.assertEqual(
-                ml_diffs[0].status, FileStatus.OUTDATED
-            )
-            self.assertIn(
-                "differs", ml_diffs[0].diff_summary
-            )
+        plugin_dir = self._copy_plugin()
+        # Write a .markdownlint.json with different
+        # content from the template
+        (plugin_dir / ".markdownlint.json").write_bytes(
+            b'{"old": "config"}\n'
+        )
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        ml_diffs = [
+            f
+            for f in report.files
+            if f.path == ".markdownlint.json"
+        ]
+        self.assertEqual(len(ml_diffs), 1)
+        self.assertEqual(
+            ml_diffs[0].status, FileStatus.OUTDATED
+        )
+        self.assertIn(
+            "differs", ml_diffs[0].diff_summary
+        )
 
 
 class TestScanPluginInvalid(unittest.TestCase):
     """Test scan_plugin with invalid inputs."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_raises_on_missing_plugin_json(
-        self, _mock_git
-    ):
+    def test_raises_on_missing_plugin_json(self):
         """Should raise ValueError when plugin.json absent."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = Path(tmp) / "no-manifest"
-            plugin_dir.mkdir()
-            with self.assertRaises(ValueError) as ctx:
-                scan_plugin(plugin_dir, TEMPLATES_DIR)
-            self.assertIn(
-                "plugin.json", str(ctx.exception)
-            )
+        tmp = make_tmp(self)
+        plugin_dir = Path(tmp) / "no-manifest"
+        plugin_dir.mkdir()
+        with self.assertRaises(ValueError) as ctx:
+            scan_plugin(plugin_dir, TEMPLATES_DIR)
+        self.assertIn(
+            "plugin.json", str(ctx.exception)
+        )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_raises_on_nonexistent_path(
-        self, _mock_git
-    ):
+    def test_raises_on_nonexistent_path(self):
         """Should raise ValueError for nonexistent path."""
         bogus = Path("/tmp/does-not-exist-scanner-test")
         with self.assertRaises(ValueError):
             scan_plugin(bogus, TEMPLATES_DIR)
 
 
-class TestScanPluginDependencyConfig(unittest.TestCase):
+class TestScanPluginDependencyConfig(_ScanTestCase):
     """Test scan_plugin dependency config handling."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_pyproject_flagged_manual_review(
-        self, _mock_git
-    ):
+    def test_pyproject_flagged_manual_review(self):
         """Should flag pyproject.toml for manual review."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            pyp_diffs = [
-                f
-                for f in report.files
-                if f.path == "pyproject.toml"
-            ]
-            self.assertEqual(len(pyp_diffs), 1)
-            self.assertEqual(
-                pyp_diffs[0].strategy,
-                MergeStrategy.MANUAL_REVIEW,
-            )
-            self.assertEqual(
-                pyp_diffs[0].category,
-                FileCategory.DEPENDENCY_CONFIG,
-            )
-            # File exists so should be UP_TO_DATE
-            self.assertEqual(
-                pyp_diffs[0].status,
-                FileStatus.UP_TO_DATE,
-            )
-
-
-class TestScanPluginComposites(unittest.TestCase):
+        report = _base_report()
+        pyp_diffs = [
+            f
+            for f in report.files
+            if f.path == "pyproject.toml"
+        ]
+        self.assertEqual(len(pyp_diffs), 1)
+        self.assertEqual(
+            pyp_diffs[0].strategy,
+            MergeStrategy.MANUAL_REVIEW,
+        )
+        self.assertEqual(
+            pyp_diffs[0].category,
+            FileCategory.DEPENDENCY_CONFIG,
+        )
+        # File exists so should be UP_TO_DATE
+        self.assertEqual(
+            pyp_diffs[0].status,
+            FileStatus.UP_TO_DATE,
+        )
+
+
+class TestScanPluginComposites(_ScanTestCase):
     """Test scan_plugin composite file handling."""
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_gitignore_missing_entries_detected(
-        self, _mock_git
-    ):
+    def test_gitignore_missing_entries_detected(self):
         """Should detect .gitignore with missing entries."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            # Write a minimal .gitignore that's missing
-            # most expected entries
-            (plugin_dir / ".gitignore").write_text(
-                "node_modules/\n"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            gi_diffs = [
-                f
-                for f in report.files
-                if f.path == ".gitignore"
-            ]
-            self.assertEqual(len(gi_diffs), 1)
-            self.assertEqual(
-                gi_diffs[0].status, FileStatus.OUTDATED
-            )
-            self.assertIn(
-                "Missing", gi_diffs[0].diff_summary
-            )
-            self.assertIn(
-                "entries", gi_diffs[0].diff_summary
-            )
+        plugin_dir = self._copy_plugin()
+        # Write a minimal .gitignore that's missing
+        # most expected entries
+        (plugin_dir / ".gitignore").write_bytes(
+            b"node_modules/\n"
+        )
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        gi_diffs = [
+            f
+            for f in report.files
+            if f.path == ".gitignore"
+        ]
+        self.assertEqual(len(gi_diffs), 1)
+        self.assertEqual(
+            gi_diffs[0].status, FileStatus.OUTDATED
+        )
+        self.assertIn(
+            "Missing", gi_diffs[0].diff_summary
+        )
+        self.assertIn(
+            "entries", gi_diffs[0].diff_summary
+        )
 
-    @patch.object(
-        _context_mod, "infer_git_config",
-        return_value=_GIT_MOCK_RETURN,
-    )
-    def test_makefile_missing_targets_detected(
-        self, _mock_git
-    ):
+    def test_makefile_missing_targets_detected(self):
         """Should detect Makefile with missing targets."""
-        with tempfile.TemporaryDirectory() as tmp:
-            plugin_dir = _create_test_plugin(Path(tmp))
-            # Write a minimal Makefile missing most targets
-            (plugin_dir / "Makefile").write_text(
-                "help:\n\t@echo help\n"
-            )
-            report = scan_plugin(
-                plugin_dir, TEMPLATES_DIR
-            )
-            mf_diffs = [
-                f
-                for f in report.files
-                if f.path == "Makefile"
-            ]
-            self.assertEqual(len(mf_diffs), 1)
-            self.assertEqual(
-                mf_diffs[0].status, FileStatus.OUTDATED
-            )
-            self.assertIn(
-                "Missing", mf_diffs[0].diff_summary
-            )
-            self.assertIn(
-                "targets", mf_diffs[0].diff_summary
-            )
+        plugin_dir = self._copy_plugin()
+        # Write a minimal Makefile missing most targets
+        (plugin_dir / "Makefile").write_bytes(
+            b"help:\n\t@echo help\n"
+        )
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        mf_diffs = [
+            f
+            for f in report.files
+            if f.path == "Makefile"
+        ]
+        self.assertEqual(len(mf_diffs), 1)
+        self.assertEqual(
+            mf_diffs[0].status, FileStatus.OUTDATED
+        )
+        self.assertIn(
+            "Missing", mf_diffs[0].diff_summary
+        )
+        self.assertIn(
+            "targets", mf_diffs[0].diff_summary
+        )
+
+    def test_scaffolded_composites_up_to_date(self):
+        """Should report verbatim scaffold composites as UP_TO_DATE."""
+        plugin_dir = self._copy_plugin()
+        expected = {
+            f.path: f.expected_content
+            for f in _base_report().files
+            if f.path in (".gitignore", "Makefile")
+        }
+        self.assertEqual(set(expected), {".gitignore", "Makefile"})
+        for path, content in expected.items():
+            (plugin_dir / path).write_text(content)
+        report = scan_plugin(
+            plugin_dir, TEMPLATES_DIR
+        )
+        by_path = {f.path: f for f in report.files}
+        for path in expected:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    by_path[path].status, FileStatus.UP_TO_DATE
+                )
 
 
 if __name__ == "__main__":